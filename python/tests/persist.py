@@ -0,0 +1,63 @@
+import pathlib
+import sqlite3
+import tempfile
+
+import undr.persist
+
+
+def test_legacy_upgrade(tmp_path: pathlib.Path):
+    path = tmp_path / "legacy.db"
+    connection = sqlite3.connect(path)
+    connection.execute("create table complete (id text primary key) without rowid")
+    connection.executemany(
+        "insert into complete values (?)", (("a",), ("b/c",), ("b/d",))
+    )
+    connection.commit()
+    connection.close()
+
+    with undr.persist.ReadOnlyStore(path) as store:
+        assert "b/c" in store
+        assert "e" not in store
+    connection = sqlite3.connect(path)
+    assert (
+        connection.execute(undr.persist.TABLE_INFO_SQL).fetchall()
+        == undr.persist.LEGACY_TABLE_COLUMNS
+    )
+    connection.close()
+
+    with undr.persist.Store(path) as store:
+        assert "a" in store
+        assert "b/c" in store
+        assert "b/d" in store
+        assert "e" not in store
+    connection = sqlite3.connect(path)
+    assert (
+        connection.execute(undr.persist.TABLE_INFO_SQL).fetchall()
+        == undr.persist.TABLE_COLUMNS
+    )
+    connection.close()
+
+
+def test_add_then_contains(tmp_path: pathlib.Path):
+    with undr.persist.Store(tmp_path / "store.db") as store:
+        store.add("a")
+        assert "a" in store
+        store.commit()
+        assert "a" in store
+        assert "b" not in store
+        store.add_many(["b", "c"])
+        assert "b" in store
+        store.commit()
+        assert "b" in store
+        assert "c" in store
+        store.reset()
+        # lookups before the worker thread drops the table must not be cached
+        "a" in store
+        store.commit()
+        assert "a" not in store
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as directory:
+        test_legacy_upgrade(pathlib.Path(directory))
+        test_add_then_contains(pathlib.Path(directory))
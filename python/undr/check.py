@@ -3,16 +3,19 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import dataclasses
-import itertools
 import json
+import os
 import pathlib
+import stat
 import typing
 
 import numpy
 import requests
 
 from . import (
+    constants,
     decode,
     formats,
     json_index,
@@ -21,7 +24,6 @@ from . import (
     path_directory,
     remote,
     task,
-    utilities,
 )
 
 
@@ -38,6 +40,40 @@ class Error:
     """
 
 
+def count_non_monotonic(t: numpy.ndarray, previous_t: int) -> int:
+    """Counts the timestamps that are smaller than their predecessor in a packet.
+
+    Args:
+        t (numpy.ndarray): The packet's timestamps.
+        previous_t (int): Last timestamp of the previous packet, or 0 for the first packet.
+
+    Returns:
+        int: Number of non-monotonic timestamps, including the transition between the previous packet and this one.
+    """
+    if len(t) == 0:
+        return 0
+    return int(t[0] < previous_t) + int(numpy.count_nonzero(t[1:] < t[:-1]))
+
+
+def count_out_of_bounds(
+    x: numpy.ndarray, y: numpy.ndarray, width: int, height: int
+) -> int:
+    """Counts the events whose coordinates are outside the sensor.
+
+    Args:
+        x (numpy.ndarray): The packet's x coordinates.
+        y (numpy.ndarray): The packet's y coordinates.
+        width (int): Sensor width in pixels.
+        height (int): Sensor height in pixels.
+
+    Returns:
+        int: Number of events with x >= width or y >= height.
+    """
+    mask = x >= width
+    numpy.logical_or(mask, y >= height, out=mask)
+    return int(numpy.count_nonzero(mask))
+
+
 def handle_aps(file: formats.ApsFile, send_message: formats.SendMessage):
     """Checks the invariants of an APS file.
 
@@ -52,13 +88,10 @@ def handle_aps(file: formats.ApsFile, send_message: formats.SendMessage):
         previous_t = 0
         for frames in file.packets():
             empty = False
-            if len(frames) > 0 and frames["t"][0] < previous_t:
-                non_monotonic_ts += 1
+            non_monotonic_ts += count_non_monotonic(frames["t"], previous_t)
+            if len(frames) > 0:
                 previous_t = frames["t"][-1]
-            non_monotonic_ts += numpy.count_nonzero(
-                numpy.diff(frames["t"].astype("<i8")) < 0
-            )
-            size_mismatches = numpy.count_nonzero(
+            size_mismatches += numpy.count_nonzero(
                 numpy.logical_or(
                     frames["width"] != file.width, frames["height"] != file.height
                 )
@@ -102,16 +135,13 @@ def handle_dvs(file: formats.DvsFile, send_message: formats.SendMessage):
     empty = True
     try:
         previous_t = 0
-        for events in file.packets():
+        for events in file.packets_soa(fields=("t", "x", "y")):
             empty = False
-            if len(events) > 0 and events["t"][0] < previous_t:
-                non_monotonic_ts += 1
+            non_monotonic_ts += count_non_monotonic(events["t"], previous_t)
+            if len(events["t"]) > 0:
                 previous_t = events["t"][-1]
-            non_monotonic_ts += numpy.count_nonzero(
-                numpy.diff(events["t"].astype("<i8")) < 0
-            )
-            out_of_bounds_count += numpy.count_nonzero(
-                numpy.logical_or(events["x"] >= file.width, events["y"] >= file.height)
+            out_of_bounds_count += count_out_of_bounds(
+                events["x"], events["y"], file.width, file.height
             )
     except decode.RemainingBytesError as error:
         empty = False
@@ -153,12 +183,9 @@ def handle_imu(file: formats.ImuFile, send_message: formats.SendMessage):
         previous_t = 0
         for imus in file.packets():
             empty = False
-            if len(imus) > 0 and imus["t"][0] < previous_t:
-                non_monotonic_ts += 1
+            non_monotonic_ts += count_non_monotonic(imus["t"], previous_t)
+            if len(imus) > 0:
                 previous_t = imus["t"][-1]
-            non_monotonic_ts += numpy.count_nonzero(
-                numpy.diff(imus["t"].astype("<i8")) < 0
-            )
     except decode.RemainingBytesError as error:
         send_message(
             Error(path_id=file.path_id, message=f"{len(error.buffer)} extra bytes")
@@ -191,116 +218,200 @@ def handle_other(file: path.File, send_message: formats.SendMessage):
 
 def handle_directory(
     directory: path_directory.Directory, send_message: formats.SendMessage
-):
+) -> list[path.File]:
     """Checks that system files are listed in the index, and vice-versa.
 
     Args:
         directory (path_directory.Directory): The directory to check.
         send_message (formats.SendMessage): Callback channel for errors.
+
+    Returns:
+        list[path.File]: The files listed in the directory's index, data files first.
     """
     index_data = json_index.load(directory.local_path / "-index.json")
-    children = set(directory.local_path.iterdir())
-    for file in itertools.chain(
-        (
-            formats.file_from_dict(data=data, parent=directory)
-            for data in index_data["files"]
-        ),
-        (
-            path.File.from_dict(data=data, parent=directory)
-            for data in index_data["other_files"]
-        ),
-    ):
-        local_path = utilities.path_with_suffix(
-            file.local_path, file.best_compression.suffix
-        )
-        if not local_path in children:
+    with os.scandir(directory.local_path) as entries:
+        children = {entry.name: entry for entry in entries}
+    files = [
+        formats.file_from_dict(data=data, parent=directory)
+        for data in index_data["files"]
+    ] + [
+        path.File.from_dict(data=data, parent=directory)
+        for data in index_data["other_files"]
+    ]
+    for file in files:
+        name = f"{file.path_id.name}{file.best_compression.suffix}"
+        entry = children.pop(name, None)
+        if entry is None:
             send_message(
                 Error(
                     path_id=file.path_id,
-                    message=f"{local_path} does not exist",
+                    message=f"{directory.local_path / name} does not exist",
                 )
             )
-        children.remove(local_path)
-        if not local_path.is_file():
+        elif not entry.is_file():
             send_message(
                 Error(
                     path_id=file.path_id,
-                    message=f"{local_path} is not a file",
+                    message=f"{directory.local_path / name} is not a file",
                 )
             )
     for child_directory_name in index_data["directories"]:
-        directory_path = directory.local_path / child_directory_name
-        if not directory_path in children:
+        entry = children.pop(child_directory_name, None)
+        if entry is None:
             send_message(
                 Error(
                     path_id=directory.path_id,
-                    message=f"{directory_path} does not exist",
+                    message=f"{directory.local_path / child_directory_name} does not exist",
                 )
             )
-        children.remove(directory_path)
-        if not directory_path.is_dir():
+        elif not entry.is_dir():
             send_message(
                 Error(
                     path_id=directory.path_id,
-                    message=f"{directory_path} is not a directory",
+                    message=f"{directory.local_path / child_directory_name} is not a directory",
                 )
             )
-    for child in children:
-        if child.name != "-index.json":
+    for name in children:
+        if name != "-index.json":
             send_message(
                 Error(
                     path_id=directory.path_id,
-                    message=f"{child} is not listed in {directory.local_path / '-index.json'}",
+                    message=f"{directory.local_path / name} is not listed in {directory.local_path / '-index.json'}",
                 )
             )
+    return files
 
 
-def structure_recursive(path: pathlib.Path):
-    """Rexucrively checks that the given path exists and that it has an UNDR structure (-index.json).
+def structure(path: pathlib.Path) -> list[pathlib.Path]:
+    """Checks that the given path exists and that it has an UNDR structure (-index.json).
+
+    This function requires a single stat call, unless the check fails.
 
     Args:
         path (pathlib.Path): The local file path to check.
 
     Raises:
         RuntimeError: if the path is not a directory or does not contain a -index.json file.
+
+    Returns:
+        list[pathlib.Path]: The paths of the child directories listed in the index.
     """
-    if not path.exists():
-        raise RuntimeError(f"{path} does not exist")
-    if not path.is_dir():
-        raise RuntimeError(f"{path} is not a directory")
     index_path = path / "-index.json"
-    if not index_path.exists():
+    try:
+        index_stat = os.stat(index_path)
+    except (FileNotFoundError, NotADirectoryError):
+        if not path.exists():
+            raise RuntimeError(f"{path} does not exist")
+        if not path.is_dir():
+            raise RuntimeError(f"{path} is not a directory")
         raise RuntimeError(f"{index_path} does not exist")
-    if not index_path.is_file():
+    if not stat.S_ISREG(index_stat.st_mode):
         raise RuntimeError(f"{index_path} is not a file")
-    index_data = json_index.load(index_path)
-    for child_directory_name in index_data["directories"]:
-        structure_recursive(path / child_directory_name)
+    index_data = json_index.load_with_signature(
+        path=index_path,
+        modification_time_ns=index_stat.st_mtime_ns,
+        size=index_stat.st_size,
+    )
+    return [
+        path / child_directory_name
+        for child_directory_name in index_data["directories"]
+    ]
 
 
-def format_index_recursive(
-    path: pathlib.Path, handle_path: typing.Callable[[pathlib.Path], None]
-):
+def structure_recursive(path: pathlib.Path):
+    """Rexucrively checks that the given path exists and that it has an UNDR structure (-index.json).
+
+    The directories of each level of the hierarchy are checked in parallel by a thread pool (see :py:func:`structure`).
+
+    Args:
+        path (pathlib.Path): The local file path to check.
+
+    Raises:
+        RuntimeError: if the path is not a directory or does not contain a -index.json file.
+    """
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        paths = [path]
+        while len(paths) > 0:
+            paths = [
+                child_path
+                for child_paths in executor.map(structure, paths)
+                for child_path in child_paths
+            ]
+
+
+def file_content_equals(path: pathlib.Path, content: bytes) -> bool:
+    """Compares a file with the given bytes without loading the whole file in memory.
+
+    The file is read in chunks only if its size matches the content's length.
+
+    Args:
+        path (pathlib.Path): The file to compare.
+        content (bytes): The expected file content.
+
+    Returns:
+        bool: Whether the file's bytes are identical to content.
+    """
+    if os.stat(path).st_size != len(content):
+        return False
+    view = memoryview(content)
+    offset = 0
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(constants.CHUNK_SIZE), b""):
+            if view[offset : offset + len(chunk)] != chunk:
+                return False
+            offset += len(chunk)
+    return offset == len(content)
+
+
+def format_index(path: pathlib.Path) -> tuple[bool, list[pathlib.Path]]:
     """Validates the given index and formats its content.
 
+    The index is parsed and validated by :py:func:`undr.json_index.load`, which re-uses the result of previous loads (for instance by :py:func:`structure_recursive`).
+
     Args:
         path (pathlib.Path): Path of the index's parent directory.
-        handle_path (typing.Callable[[pathlib.Path], None]): Called if the index was reformatted.
+
+    Returns:
+        tuple[bool, list[pathlib.Path]]: Whether the index was reformatted and the paths of the child directories listed in the index.
     """
     index_path = path / "-index.json"
-    with open(index_path, "rb") as index_file:
-        index_content = index_file.read()
-    index_data = json.loads(index_content)
-    json_index.validate(index_data)
+    index_data = json_index.load(index_path)
     new_index_content = f"{json.dumps(index_data, sort_keys=True, indent=4)}\n".encode()
-    if index_content != new_index_content:
-        handle_path(index_path)
+    formatted = not file_content_equals(path=index_path, content=new_index_content)
+    if formatted:
         with open(index_path, "wb") as index_file:
             index_file.write(new_index_content)
-    for child_directory_name in index_data["directories"]:
-        format_index_recursive(
-            path=path / child_directory_name, handle_path=handle_path
-        )
+    return (
+        formatted,
+        [
+            path / child_directory_name
+            for child_directory_name in index_data["directories"]
+        ],
+    )
+
+
+def format_index_recursive(
+    path: pathlib.Path, handle_path: typing.Callable[[pathlib.Path], None]
+):
+    """Validates the given index and formats its content recursively.
+
+    The indexes of each level of the hierarchy are formatted in parallel by a thread pool (see :py:func:`format_index`). handle_path is called on the calling thread, in the order of the indexes' directories lists.
+
+    Args:
+        path (pathlib.Path): Path of the index's parent directory.
+        handle_path (typing.Callable[[pathlib.Path], None]): Called if the index was reformatted.
+    """
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        paths = [path]
+        while len(paths) > 0:
+            next_paths: list[pathlib.Path] = []
+            for path, (formatted, child_paths) in zip(
+                paths, executor.map(format_index, paths)
+            ):
+                if formatted:
+                    handle_path(path / "-index.json")
+                next_paths.extend(child_paths)
+            paths = next_paths
 
 
 class CheckFile(json_index_tasks.ProcessFile):
@@ -356,35 +467,32 @@ class CheckLocalDirectoryRecursive(task.Task):
             server=remote.NullServer(),
             doi_and_metadata_loaded=False,
         )
-        handle_directory(
+        files = handle_directory(
             directory=directory,
             send_message=lambda message: manager.send_message(
                 Error(path_id=directory.path_id, message=message)
             ),
         )
         index_data = json_index.load(directory.local_path / "-index.json")
-        for file in itertools.chain(
-            (
-                formats.file_from_dict(data=data, parent=directory)
-                for data in index_data["files"]
-            ),
-            (
-                path.File.from_dict(data=data, parent=directory)
-                for data in index_data["other_files"]
-            ),
-        ):
-            manager.schedule(
-                CheckFile(
-                    file=file,
-                    switch=formats.Switch(
-                        handle_aps=handle_aps,
-                        handle_dvs=handle_dvs,
-                        handle_imu=handle_imu,
-                        handle_other=handle_other,
-                    ),
-                ),
-                priority=self.priority,
-            )
+        switch = formats.Switch(
+            handle_aps=handle_aps,
+            handle_dvs=handle_dvs,
+            handle_imu=handle_imu,
+            handle_other=handle_other,
+        )
+        batch: list[task.Task] = []
+        for file in files:
+            if file.size >= constants.BATCH_FILE_THRESHOLD:
+                manager.schedule(
+                    CheckFile(file=file, switch=switch), priority=self.priority
+                )
+                continue
+            batch.append(CheckFile(file=file, switch=switch))
+            if len(batch) == constants.BATCH_MAXIMUM_COUNT:
+                manager.schedule(task.Batch(tasks=batch), priority=self.priority)
+                batch = []
+        if len(batch) > 0:
+            manager.schedule(task.Batch(tasks=batch), priority=self.priority)
         for child_directory_name in index_data["directories"]:
             manager.schedule(
                 CheckLocalDirectoryRecursive(
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import contextlib
 import dataclasses
 import logging
@@ -502,6 +504,7 @@ class Configuration:
         Returns:
             str: BibTeX references as a string.
         """
+        doi_to_bibtex: dict[str, concurrent.futures.Future[str]] = {}
         with (
             display.Display(
                 statuses=[
@@ -521,7 +524,7 @@ class Configuration:
             else contextlib.nullcontext()
         ) as progress_display, task.ProcessManager(
             workers=workers, priority_levels=2, log_directory=log_directory
-        ) as manager:
+        ) as manager, concurrent.futures.ThreadPoolExecutor() as executor:
             selector = DoiSelector()
             for dataset_settings in self.enabled_datasets_settings():
                 manager.schedule(
@@ -541,41 +544,30 @@ class Configuration:
                     ),
                     priority=0,
                 )
-            doi_to_path_ids_and_bibtex: dict[
-                str, tuple[list[pathlib.PurePosixPath], str]
-            ] = {}
+            doi_to_path_ids: collections.defaultdict[
+                str, list[pathlib.PurePosixPath]
+            ] = collections.defaultdict(list)
             for message in manager.messages():
                 if isinstance(message, task.WorkerException):
                     raise message
                 if progress_display is not None:
                     progress_display.push(message)
                 if isinstance(message, json_index_tasks.Doi):
-                    if message.value in doi_to_path_ids_and_bibtex:
-                        doi_to_path_ids_and_bibtex[message.value][0].append(
-                            message.path_id
+                    if message.value not in doi_to_bibtex:
+                        doi_to_bibtex[message.value] = executor.submit(
+                            bibtex.from_doi,
+                            doi=message.value,
+                            pretty=True,
+                            timeout=bibtex_timeout,
                         )
-                    else:
-                        try:
-                            doi_to_path_ids_and_bibtex[message.value] = (
-                                [message.path_id],
-                                bibtex.from_doi(
-                                    doi=message.value,
-                                    pretty=True,
-                                    timeout=bibtex_timeout,
-                                ),
-                            )
-                        except (
-                            requests.HTTPError,
-                            requests.ConnectionError,
-                        ) as exception:
-                            doi_to_path_ids_and_bibtex[message.value] = (
-                                [message.path_id],
-                                f"% downloading application/x-bibtex data from https://dx.doi.org/{message.value} failed, {exception}\n",
-                            )
-        path_ids_and_bibtexs = [
-            (sorted(path_ids), bibtex)
-            for _, (path_ids, bibtex) in doi_to_path_ids_and_bibtex.items()
-        ]
+                    doi_to_path_ids[message.value].append(message.path_id)
+        path_ids_and_bibtexs: list[tuple[list[pathlib.PurePosixPath], str]] = []
+        for doi, path_ids in doi_to_path_ids.items():
+            try:
+                bibtex_content = doi_to_bibtex[doi].result()
+            except (requests.HTTPError, requests.ConnectionError) as exception:
+                bibtex_content = f"% downloading application/x-bibtex data from https://dx.doi.org/{doi} failed, {exception}\n"
+            path_ids_and_bibtexs.append((sorted(path_ids), bibtex_content))
         path_ids_and_bibtexs.sort(
             key=lambda path_ids_and_bibtex: path_ids_and_bibtex[0][0]
         )
@@ -1,7 +1,51 @@
 """Constants used throughout the codebase."""
 
-CHUNK_SIZE: int = 65536
-"""Buffer size in bytes for file reads."""
+from __future__ import annotations
+
+import os
+
+SIZE_SUFFIX_TO_MULTIPLIER: dict[str, int] = {
+    "K": 1 << 10,
+    "M": 1 << 20,
+    "G": 1 << 30,
+    "T": 1 << 40,
+}
+"""Binary multipliers for the units supported by :py:func:`parse_size`."""
+
+
+def parse_size(size: str) -> int:
+    """Converts a human-readable size to a number of bytes.
+
+    Sizes are integers or decimal numbers followed by an optional binary unit, for instance ``"65536"``, ``"256K"``, or ``"1.5M"``. Units are case-insensitive.
+
+    Args:
+        size (str): The human-readable size.
+
+    Raises:
+        ValueError: if the size cannot be parsed or is not strictly positive.
+
+    Returns:
+        int: Size in bytes.
+    """
+    size = size.strip()
+    multiplier = SIZE_SUFFIX_TO_MULTIPLIER.get(size[-1:].upper())
+    if multiplier is None:
+        result = int(size)
+    else:
+        result = int(float(size[:-1]) * multiplier)
+    if result <= 0:
+        raise ValueError(f'the size "{size}" must be strictly positive')
+    return result
+
+
+BATCH_FILE_THRESHOLD: int = 1 << 22
+"""Files smaller than this size in bytes are checked in batches to reduce scheduling overhead."""
+
+BATCH_MAXIMUM_COUNT: int = 8
+"""Maximum number of small files in a batch."""
+
+CHUNK_SIZE: int = parse_size(os.getenv("UNDR_CHUNK_SIZE", "1M"))
+"""Buffer size in bytes for file reads, can be overriden with the environment variable ``UNDR_CHUNK_SIZE`` (for instance ``UNDR_CHUNK_SIZE=256K``)."""
 
 CONSUMER_POLL_PERIOD: float = 0.1
 """Sleep duration for msssage readers."""
@@ -15,14 +59,32 @@ DEFAULT_TIMEOUT: float = 60.0
 DOWNLOAD_SUFFIX: str = ".download"
 """Suffix indicating that a file is being downloaded."""
 
-LRU_CACHE_MAXSIZE: int = 128
-"""Number of index files cached by the load function."""
+HASH_ALGORITHM: str = "sha3_224"
+"""Name of the :py:mod:`hashlib` algorithm used to verify files.
+
+The UNDR index specification stores SHA3-224 (FIPS 202) hashes, changing this value requires re-hashing the datasets' index files.
+"""
+
+LRU_CACHE_MAXSIZE: int = int(os.getenv("UNDR_LRU_CACHE_MAXSIZE", "1024"))
+"""Number of index files cached by the load function, can be overriden with the environment variable ``UNDR_LRU_CACHE_MAXSIZE``."""
+
+PROGRESS_MAXIMUM_DELAY: float = 0.05
+"""Maximum time in seconds between two progress messages while bytes are read, downloaded, or decompressed (see :py:class:`undr.task.ProgressBuffer`)."""
+
+PROGRESS_THRESHOLD: int = 4 * 1024 * 1024
+"""Number of bytes read or decompressed before a progress message is sent (see :py:class:`undr.task.ProgressBuffer`)."""
+
+READ_AHEAD_THRESHOLD: int = 16 * 1024 * 1024
+"""Above this size in bytes, files are read in a background thread while their bytes are processed."""
 
 SPEED_SAMPLES: int = 30
 """Number of samples used to smooth the speed measurement (sliding window)."""
 
-STREAM_CHUNK_THRESHOLD: int = 64
-"""Below this number, files are download in one chunk instead of several to boost performance."""
+STORE_CACHE_MAXSIZE: int = int(os.getenv("UNDR_STORE_CACHE_MAXSIZE", "4096"))
+"""Number of membership test results cached by each progress store, can be overriden with the environment variable ``UNDR_STORE_CACHE_MAXSIZE``."""
+
+STREAM_CHUNK_THRESHOLD: int = 4
+"""Below this number of chunks, files are download in one chunk instead of several to boost performance."""
 
 WORKER_POLL_PERIOD: float = 0.02
 """Sleep duration for wworkers when the task queue is empty."""
@@ -5,13 +5,14 @@ To add support for a new format, create and implement a derived class of :py:cla
 
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import pathlib
 import typing
 
 import requests
 
-from . import constants, exception, task, utilities
+from . import constants, exception, remote, task, utilities
 
 
 @dataclasses.dataclass
@@ -228,45 +229,32 @@ class DecompressFile(task.Task):
 
     def run(self, session: requests.Session, manager: task.Manager):
         hash = utilities.new_hash()
+        file_path = self.path_root / self.path_id
+        compressed_path = utilities.path_with_suffix(file_path, self.compression.suffix)
         decompress_path = utilities.path_with_suffix(
-            self.path_root / self.path_id, constants.DECOMPRESS_SUFFIX
+            file_path, constants.DECOMPRESS_SUFFIX
         )
-        with open(
-            utilities.path_with_suffix(
-                self.path_root / self.path_id, self.compression.suffix
-            ),
-            "rb",
-        ) as compressed_file:
+        with open(compressed_path, "rb") as compressed_file, contextlib.closing(
+            utilities.read_chunks(
+                input=compressed_file, chunk_size=constants.CHUNK_SIZE
+            )
+        ) as compressed_buffers:
             with open(decompress_path, "wb") as decompressed_file:
                 decoder = self.compression.decoder(word_size=self.word_size)
-                while True:
-                    compressed_buffer = compressed_file.read(constants.CHUNK_SIZE)
-                    if len(compressed_buffer) == 0:
-                        break
+                progress = task.ProgressBuffer(
+                    manager=manager, progress_type=Progress, path_id=self.path_id
+                )
+                for compressed_buffer in compressed_buffers:
                     decompressed_buffer = decoder.decompress(compressed_buffer)
                     decompressed_file.write(decompressed_buffer)
                     hash.update(decompressed_buffer)
-                    manager.send_message(
-                        Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(decompressed_buffer),
-                            final_bytes=len(decompressed_buffer),
-                            complete=False,
-                        )
-                    )
+                    progress.add(len(decompressed_buffer))
                 (decompressed_buffer, remaining_bytes) = decoder.finish()
-                decompressed_file.write(decompressed_buffer)
-                hash.update(decompressed_buffer)
-                manager.send_message(
-                    Progress(
-                        path_id=self.path_id,
-                        initial_bytes=0,
-                        current_bytes=len(decompressed_buffer),
-                        final_bytes=len(decompressed_buffer),
-                        complete=False,
-                    )
-                )
+                if len(decompressed_buffer) > 0:
+                    decompressed_file.write(decompressed_buffer)
+                    hash.update(decompressed_buffer)
+                    progress.add(len(decompressed_buffer))
+                progress.flush()
                 if len(remaining_bytes) > 0:
                     raise RemainingBytesError(
                         word_size=self.word_size, buffer=remaining_bytes
@@ -277,11 +265,154 @@ class DecompressFile(task.Task):
         digest = hash.hexdigest()
         if digest != self.expected_hash:
             exception.HashMismatch(self.path_id, self.expected_hash, digest)
-        decompress_path.replace(self.path_root / self.path_id)
+        decompress_path.replace(file_path)
         if not self.keep:
-            utilities.path_with_suffix(
-                self.path_root / self.path_id, self.compression.suffix
-            ).unlink()
+            compressed_path.unlink()
+        manager.send_message(
+            Progress(
+                path_id=self.path_id,
+                initial_bytes=0,
+                current_bytes=0,
+                final_bytes=0,
+                complete=True,
+            )
+        )
+
+
+class DownloadDecompressFile(remote.Download):
+    """Downloads a compressed resource and decompresses it on the fly, without writing the compressed file to disk.
+
+    This task is equivalent to a :py:class:`undr.remote.DownloadFile` followed by a :py:class:`DecompressFile` that does not keep the compressed file, and sends the same progress messages. Interrupted downloads start over since the decoder state cannot be restored from a partial file.
+
+    Args:
+        path_root (pathlib.Path): The root path used to generate local file paths.
+        path_id (pathlib.PurePosixPath): The path ID of the file.
+        compression (Compression): The format of the remote compressed file.
+        server (remote.Server): The remote server.
+        expected_size (int): The size of the decompressed file in bytes, according to the index.
+        expected_hash (str): The hash of the decompressed file, according to the index.
+        word_size (int): The file's word size (the number of decoded bytes must be a multiple of this value).
+    """
+
+    def __init__(
+        self,
+        path_root: pathlib.Path,
+        path_id: pathlib.PurePosixPath,
+        compression: Compression,
+        server: remote.Server,
+        expected_size: int,
+        expected_hash: str,
+        word_size: int,
+    ):
+        super().__init__(
+            path_id=path_id,
+            suffix=compression.suffix,
+            server=server,
+            stream=compression.size
+            >= constants.CHUNK_SIZE * constants.STREAM_CHUNK_THRESHOLD,
+        )
+        self.path_root = path_root
+        self.compression = compression
+        self.expected_size = expected_size
+        self.expected_hash = expected_hash
+        self.word_size = word_size
+
+    def decompress_path(self) -> pathlib.Path:
+        """Returns the path of the decompressed file while it is being written.
+
+        Returns:
+            pathlib.Path: Local file path with the suffix :py:attr:`undr.constants.DECOMPRESS_SUFFIX`.
+        """
+        return utilities.path_with_suffix(
+            self.path_root / self.path_id, constants.DECOMPRESS_SUFFIX
+        )
+
+    def on_begin(self, manager: task.Manager) -> int:
+        return 0
+
+    def on_response_ready(
+        self, response: requests.Response, manager: task.Manager
+    ) -> None:
+        """Decompresses the response chunks and writes them to the file.
+
+        Args:
+            response (requests.Response): HTTP response object.
+            manager (task.Manager): The task manager for reporting updates.
+
+        Raises:
+            exception.SizeMismatch: if the size of the downloaded data is not the size of the compressed file.
+            exception.HashMismatch: if the hash of the downloaded data is not the hash of the compressed file.
+            RemainingBytesError: if the number of decoded bytes is not a multiple of the word size.
+        """
+        download_hash = utilities.new_hash()
+        download_size = 0
+        self.hash = utilities.new_hash()
+        download_progress = task.ProgressBuffer(
+            manager=manager, progress_type=remote.Progress, path_id=self.path_id
+        )
+        progress = task.ProgressBuffer(
+            manager=manager, progress_type=Progress, path_id=self.path_id
+        )
+        with open(self.decompress_path(), "wb") as decompressed_file:
+            decoder = self.compression.decoder(word_size=self.word_size)
+            for compressed_buffer in response.iter_content(constants.CHUNK_SIZE):
+                download_hash.update(compressed_buffer)
+                download_size += len(compressed_buffer)
+                download_progress.add(len(compressed_buffer))
+                decompressed_buffer = decoder.decompress(compressed_buffer)
+                decompressed_file.write(decompressed_buffer)
+                self.hash.update(decompressed_buffer)
+                progress.add(len(decompressed_buffer))
+            response.close()
+            download_progress.flush()
+            if download_size != self.compression.size:
+                raise exception.SizeMismatch(
+                    self.path_id, self.compression.size, download_size
+                )
+            download_digest = download_hash.hexdigest()
+            if download_digest != self.compression.hash:
+                raise exception.HashMismatch(
+                    self.path_id, self.compression.hash, download_digest
+                )
+            manager.send_message(
+                remote.Progress(
+                    path_id=self.path_id,
+                    initial_bytes=0,
+                    current_bytes=0,
+                    final_bytes=0,
+                    complete=True,
+                )
+            )
+            decompressed_buffer, remaining_bytes = decoder.finish()
+            if len(decompressed_buffer) > 0:
+                decompressed_file.write(decompressed_buffer)
+                self.hash.update(decompressed_buffer)
+                progress.add(len(decompressed_buffer))
+            progress.flush()
+            if len(remaining_bytes) > 0:
+                raise RemainingBytesError(
+                    word_size=self.word_size, buffer=remaining_bytes
+                )
+        self.on_end(manager=manager)
+
+    def on_end(self, manager: task.Manager):
+        """Checks the decompressed file and moves it to its final path.
+
+        Args:
+            manager (task.Manager): The task manager for reporting updates.
+
+        Raises:
+            exception.SizeMismatch: if the size of the decompressed file is not the expected size.
+            exception.HashMismatch: if the hash of the decompressed file is not the expected hash.
+        """
+        decompress_path = self.decompress_path()
+        size = decompress_path.stat().st_size
+        if size != self.expected_size:
+            raise exception.SizeMismatch(self.path_id, self.expected_size, size)
+        digest = self.hash.hexdigest()
+        if digest != self.expected_hash:
+            raise exception.HashMismatch(self.path_id, self.expected_hash, digest)
+        decompress_path.replace(self.path_root / self.path_id)
         manager.send_message(
             Progress(
                 path_id=self.path_id,
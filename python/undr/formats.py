@@ -25,7 +25,41 @@ except:
 
 
 @dataclasses.dataclass(frozen=True)
-class ApsFile(path.File):
+class PacketsFile(path.File):
+    """A file whose entries are described by a numpy structured dtype.
+
+    Derived classes implement :py:meth:`packets`.
+    """
+
+    def packets(self) -> typing.Iterable[numpy.ndarray]:
+        """Iterates over the file data.
+
+        Returns:
+            typing.Iterable[numpy.ndarray]: Iterator over the file's data converted into numpy structured arrays.
+        """
+        raise NotImplementedError()
+
+    def packets_soa(
+        self, fields: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Iterable[dict[str, numpy.ndarray]]:
+        """Iterates over the file data, with one contiguous array per field.
+
+        Similar to :py:meth:`packets`, with the fields of each packet copied into separate arrays (see :py:func:`undr.raw.split_fields`). Large fields, for instance the ``pixels`` field of APS files, should only be requested if they are needed.
+
+        Args:
+            fields (typing.Optional[typing.Iterable[str]], optional): Names of the fields to load. All the fields are loaded if this is None. Defaults to None.
+
+        Returns:
+            typing.Iterable[dict[str, numpy.ndarray]]: Iterator over the file's data converted into dictionaries of numpy arrays indexed by field name.
+        """
+        if fields is not None:
+            fields = tuple(fields)
+        for packet in self.packets():
+            yield raw.split_fields(packet=packet, fields=fields)
+
+
+@dataclasses.dataclass(frozen=True)
+class ApsFile(PacketsFile):
     """A file that contains luminance (grey levels) frames.
 
     Active-pixel sensors (APS) describe, strictly speaking, any sensor with pixels that use MOSFET amplifiers.
@@ -53,13 +87,13 @@ class ApsFile(path.File):
         Returns:
             typing.Iterable[numpy.ndarray]: Iterator over the file's data converted into numpy arrays with dtype :py:func:`undr.raw.aps_dtype`.
         """
-        dtype = numpy.dtype(raw.aps_dtype(self.width, self.height))
+        dtype = raw.aps_dtype(self.width, self.height)
         for chunk in self._chunks(word_size=self.word_size):
             yield numpy.frombuffer(chunk, dtype=dtype)
 
 
 @dataclasses.dataclass(frozen=True)
-class DvsFile(path.File):
+class DvsFile(PacketsFile):
     """A file that contains DVS (polarity) events.
 
     Dynamic Vision Sensor events, often called polarity events,
@@ -92,7 +126,7 @@ class DvsFile(path.File):
 
 
 @dataclasses.dataclass(frozen=True)
-class ImuFile(path.File):
+class ImuFile(PacketsFile):
     """A file that contains IMU events.
 
     Inertial Measurement Unit (IMU) events are produced by an accelerometer / gyroscope / magnetometer.
@@ -131,21 +165,23 @@ def file_from_dict(
         path.File: A specialized file object.
     """
     file_attributes = path.File.attributes_from_dict(data=data, parent=parent)
-    if data["properties"]["type"] == "aps":
+    properties = data["properties"]
+    file_type = properties["type"]
+    if file_type == "aps":
         return ApsFile(
             **file_attributes,
-            width=data["properties"]["width"],
-            height=data["properties"]["height"],
+            width=properties["width"],
+            height=properties["height"],
         )
-    if data["properties"]["type"] == "dvs":
+    if file_type == "dvs":
         return DvsFile(
             **file_attributes,
-            width=data["properties"]["width"],
-            height=data["properties"]["height"],
+            width=properties["width"],
+            height=properties["height"],
         )
-    if data["properties"]["type"] == "imu":
+    if file_type == "imu":
         return ImuFile(**file_attributes)
-    raise RuntimeError(f"unsupported file type {type}")
+    raise RuntimeError(f'unsupported file type "{file_type}"')
 
 
 SendMessage = typing.Callable[[typing.Any], None]
@@ -173,6 +209,17 @@ class Switch:
         typing.Callable[[path.File, SendMessage], None]
     ] = None
 
+    TYPE_TO_HANDLER_NAME: typing.ClassVar[dict[type, str]] = {
+        ApsFile: "handle_aps",
+        DvsFile: "handle_dvs",
+        ImuFile: "handle_imu",
+        path.File: "handle_other",
+    }
+    """Maps file classes to the name of their handler attribute.
+
+    Subclasses of :py:class:`ApsFile`, :py:class:`DvsFile`, and :py:class:`ImuFile` that are not listed here are dispatched with isinstance checks.
+    """
+
     def enabled_types(self) -> set[typing.Any]:
         """Lists the file types that have a non-None handler.
 
@@ -198,13 +245,13 @@ class Switch:
         Raises:
             RuntimeError: if the file type is not supported by this function.
         """
-        if self.handle_aps is not None and isinstance(file, ApsFile):
-            self.handle_aps(file, send_message)
-        elif self.handle_dvs is not None and isinstance(file, DvsFile):
-            self.handle_dvs(file, send_message)
-        elif self.handle_imu is not None and isinstance(file, ImuFile):
-            self.handle_imu(file, send_message)
-        elif self.handle_other is not None and file.__class__ == path.File:
-            self.handle_other(file, send_message)
-        else:
+        handler_name = Switch.TYPE_TO_HANDLER_NAME.get(file.__class__)
+        if handler_name is None:
+            for file_class in (ApsFile, DvsFile, ImuFile):
+                if isinstance(file, file_class):
+                    handler_name = Switch.TYPE_TO_HANDLER_NAME[file_class]
+                    break
+        handler = None if handler_name is None else getattr(self, handler_name)
+        if handler is None:
             raise RuntimeError(f"unsupported file format {file.__class__}")
+        handler(file, send_message)
@@ -2,17 +2,39 @@
 
 from __future__ import annotations
 
+import collections
 import errno
 import functools
+import hashlib
 import json
+import os
 import pathlib
+import threading
 import typing
 
 from . import constants, utilities
 
+try:
+    import orjson
+
+    loads: typing.Callable[[bytes], typing.Any] = orjson.loads
+except ImportError:
+    loads = json.loads
+"""Parses JSON bytes, with orjson (https://github.com/ijl/orjson) if it is installed and with the standard library otherwise."""
+
 validate = utilities.load_schema("-index_schema")
 """JSON schema validator for -index files."""
 
+VALIDATED_DIGESTS: collections.OrderedDict[bytes, None] = collections.OrderedDict()
+"""Digests of the most recently validated -index files, up to :py:attr:`undr.constants.LRU_CACHE_MAXSIZE`.
+
+Files whose bytes have already been validated by this process (for instance after a forced re-download) skip schema validation.
+"""
+
+VALIDATED_DIGESTS_LOCK = threading.Lock()
+"""Protects :py:attr:`VALIDATED_DIGESTS`.
+"""
+
 
 class InstallError(FileNotFoundError):
     """Raised if the target path does not exist.
@@ -31,10 +53,45 @@ class InstallError(FileNotFoundError):
 
 
 @functools.lru_cache(maxsize=constants.LRU_CACHE_MAXSIZE)
+def load_with_signature(
+    path: pathlib.Path, modification_time_ns: int, size: int
+) -> dict[str, typing.Any]:
+    """Reads and validates a -index.json file, caching the result.
+
+    The modification time and size are not used to read the file, but they are part of the cache key. Hence, cached contents are invalidated when the file changes. Validation is skipped if identical bytes were validated recently (see :py:attr:`VALIDATED_DIGESTS`).
+
+    Args:
+        path (pathlib.Path): The path of the file to read.
+        modification_time_ns (int): The file's modification time in nanoseconds.
+        size (int): The file's size in bytes.
+
+    Raises:
+        fastjsonschema.JsonSchemaValueException: if validation fails.
+
+    Returns:
+        dict[str, typing.Any]: Parsed JSON file contents.
+    """
+    with open(path, "rb") as index_data_file:
+        index_bytes = index_data_file.read()
+    index_data = loads(index_bytes)
+    digest = hashlib.blake2b(index_bytes, digest_size=16).digest()
+    with VALIDATED_DIGESTS_LOCK:
+        validated = digest in VALIDATED_DIGESTS
+        if validated:
+            VALIDATED_DIGESTS.move_to_end(digest)
+    if not validated:
+        validate(index_data)
+        with VALIDATED_DIGESTS_LOCK:
+            VALIDATED_DIGESTS[digest] = None
+            if len(VALIDATED_DIGESTS) > constants.LRU_CACHE_MAXSIZE:
+                VALIDATED_DIGESTS.popitem(last=False)
+    return index_data
+
+
 def load(path: pathlib.Path) -> dict[str, typing.Any]:
     """Reads and validates a -index.json file.
 
-    This function caches the parsed contents of up to :py:attr:`undr.constants.LRU_CACHE_MAXSIZE` files.
+    This function caches the parsed contents of up to :py:attr:`undr.constants.LRU_CACHE_MAXSIZE` files. Cached contents are re-used as long as the file's modification time and size do not change.
 
     Args:
         path (pathlib.Path): The path of the file to read.
@@ -46,11 +103,10 @@ def load(path: pathlib.Path) -> dict[str, typing.Any]:
     Returns:
         dict[str, typing.Any]: Parsed JSON file contents.
     """
-
     try:
-        with open(path) as index_data_file:
-            index_data = json.load(index_data_file)
-        validate(index_data)
-        return index_data
+        stat = os.stat(path)
+        return load_with_signature(
+            path=path, modification_time_ns=stat.st_mtime_ns, size=stat.st_size
+        )
     except FileNotFoundError:
         raise InstallError(path)
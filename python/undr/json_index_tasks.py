@@ -6,6 +6,7 @@ import dataclasses
 import enum
 import itertools
 import logging
+import os
 import pathlib
 import typing
 
@@ -289,18 +290,15 @@ class Index(remote.DownloadFile):
             process_bytes=IndexProgress(initial=0, final=0),
         )
         if not self.force:
-            if self.index_file.local_path.is_file():
-                directory_scanned.index_bytes.initial = (
-                    self.index_file.local_path.stat().st_size
-                )
-            else:
-                partial_index_path = utilities.path_with_suffix(
-                    self.path_root / self.path_id, constants.DOWNLOAD_SUFFIX
-                )
-                if partial_index_path.is_file():
-                    directory_scanned.index_bytes.initial = (
-                        partial_index_path.stat().st_size
+            size = utilities.file_size(self.index_file.local_path)
+            if size is None:
+                size = utilities.file_size(
+                    utilities.path_with_suffix(
+                        self.path_root / self.path_id, constants.DOWNLOAD_SUFFIX
                     )
+                )
+            if size is not None:
+                directory_scanned.index_bytes.initial = size
         super().run(session=session, manager=manager)
         index_data = json_index.load(self.path_root / self.path_id)
         if "doi" in index_data:
@@ -327,10 +325,8 @@ class Index(remote.DownloadFile):
                 priority=self.priority,
             )
         if self.selector.scan_filesystem(directory=directory):
-            name_to_size = {
-                path.name: path.stat().st_size
-                for path in directory.local_path.iterdir()
-            }
+            with os.scandir(directory.local_path) as entries:
+                name_to_size = {entry.name: entry.stat().st_size for entry in entries}
         else:
             name_to_size = {"-index.json": self.index_file.local_path.stat().st_size}
         directory_scanned.index_bytes.final = name_to_size["-index.json"]
@@ -446,7 +442,8 @@ class InstallFilesRecursive(task.Task):
         )
         index_data = json_index.load(directory.local_path / "-index.json")
         if self.selector.scan_filesystem(directory=directory):
-            names = set(path.name for path in directory.local_path.iterdir())
+            with os.scandir(directory.local_path) as entries:
+                names = set(entry.name for entry in entries)
         else:
             names: set[str] = set()
         for file in itertools.chain(
@@ -506,7 +503,7 @@ class InstallFilesRecursive(task.Task):
             logging.debug(
                 f"path_id={file.path_id} force={self.force} {action=} {actual_action=}"
             )
-            if actual_action != 0:
+            if actual_action == 1 or actual_action == 2:
                 download_task = remote.DownloadFile(
                     path_root=self.path_root,
                     path_id=file.path_id,
@@ -516,18 +513,9 @@ class InstallFilesRecursive(task.Task):
                     expected_size=file.best_compression.size,
                     expected_hash=file.best_compression.hash,
                 )
-                decompress_task = decode.DecompressFile(
-                    path_root=self.path_root,
-                    path_id=file.path_id,
-                    compression=file.best_compression,
-                    expected_size=file.size,
-                    expected_hash=file.hash,
-                    word_size=file.word_size,
-                    keep=False,
-                )
                 if actual_action == 1:
                     manager.schedule(download_task, self.priority)
-                elif actual_action == 2:
+                else:
                     manager.schedule(
                         task.Chain(
                             (
@@ -540,14 +528,34 @@ class InstallFilesRecursive(task.Task):
                         ),
                         self.priority,
                     )
-                elif actual_action == 3:
-                    manager.schedule(
-                        task.Chain((download_task, decompress_task)), self.priority
-                    )
-                elif actual_action == 4:
-                    manager.schedule(decompress_task, self.priority)
-                else:
-                    raise Exception(f"unexpected action {actual_action}")
+            elif actual_action == 3:
+                manager.schedule(
+                    decode.DownloadDecompressFile(
+                        path_root=self.path_root,
+                        path_id=file.path_id,
+                        compression=file.best_compression,
+                        server=self.server,
+                        expected_size=file.size,
+                        expected_hash=file.hash,
+                        word_size=file.word_size,
+                    ),
+                    self.priority,
+                )
+            elif actual_action == 4:
+                manager.schedule(
+                    decode.DecompressFile(
+                        path_root=self.path_root,
+                        path_id=file.path_id,
+                        compression=file.best_compression,
+                        expected_size=file.size,
+                        expected_hash=file.hash,
+                        word_size=file.word_size,
+                        keep=False,
+                    ),
+                    self.priority,
+                )
+            elif actual_action != 0:
+                raise Exception(f"unexpected action {actual_action}")
         for child_directory_name in index_data["directories"]:
             manager.schedule(
                 InstallFilesRecursive(
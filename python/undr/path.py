@@ -5,7 +5,6 @@ from __future__ import annotations
 import contextlib
 import dataclasses
 import functools
-import math
 import operator
 import pathlib
 import typing
@@ -168,19 +167,19 @@ class File(Path):
         Returns:
             dict[str, typing.Any]: Data that can be used to initialize this class.
         """
+        size = data["size"]
+        hash = data["hash"]
         return {
             "path_root": parent.path_root,
             "path_id": parent.path_id / data["name"],
-            "own_doi": data["doi"] if "doi" in data else None,
+            "own_doi": data.get("doi"),
             "metadata": data["metadata"],
             "server": parent.server,
-            "size": data["size"],
-            "hash": data["hash"],
+            "size": size,
+            "hash": hash,
             "compressions": tuple(
                 decode.compression_from_dict(
-                    data=compression,
-                    base_size=data["size"],
-                    base_hash=data["hash"],
+                    data=compression, base_size=size, base_hash=hash
                 )
                 for compression in data["compressions"]
             ),
@@ -220,9 +219,17 @@ class File(Path):
             typing.Iterable[bytes]: Iterator over the file's decompressed bytes.
         """
         assert word_size > 0
+        compressed_path = utilities.path_with_suffix(
+            self.local_path, self.best_compression.suffix
+        )
         if self.local_path.is_file():
             hash = utilities.new_hash()
-            chunk_size = math.ceil(65536 / word_size) * word_size
+            chunk_size = utilities.least_multiple_over_chunk_size(word_size)
+            progress = task.ProgressBuffer(
+                manager=self.manager,
+                progress_type=decode.Progress,
+                path_id=self.path_id,
+            )
             with open(self.local_path, "rb") as file_object:
                 while True:
                     chunk = file_object.read(chunk_size)
@@ -234,15 +241,8 @@ class File(Path):
                         )
                     yield chunk
                     hash.update(chunk)
-                    self.manager.send_message(
-                        decode.Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(chunk),
-                            final_bytes=len(chunk),
-                            complete=False,
-                        )
-                    )
+                    progress.add(len(chunk))
+            progress.flush()
             digest = hash.hexdigest()
             if digest != self.hash:
                 raise exception.HashMismatch(self.path_id, self.hash, digest)
@@ -255,46 +255,30 @@ class File(Path):
                     complete=True,
                 )
             )
-        elif utilities.path_with_suffix(
-            self.local_path, self.best_compression.suffix
-        ).is_file():
+        elif compressed_path.is_file():
             hash = utilities.new_hash()
-            with open(
-                utilities.path_with_suffix(
-                    self.local_path, self.best_compression.suffix
-                ),
-                "rb",
-            ) as compressed_file:
+            with open(compressed_path, "rb") as compressed_file, contextlib.closing(
+                utilities.read_chunks(
+                    input=compressed_file, chunk_size=constants.CHUNK_SIZE
+                )
+            ) as encoded_chunks:
                 decoder = self.best_compression.decoder(self.word_size)
-                while True:
-                    encoded_bytes = compressed_file.read(constants.CHUNK_SIZE)
-                    if len(encoded_bytes) == 0:
-                        break
+                progress = task.ProgressBuffer(
+                    manager=self.manager,
+                    progress_type=decode.Progress,
+                    path_id=self.path_id,
+                )
+                for encoded_bytes in encoded_chunks:
                     decoded_bytes = decoder.decompress(encoded_bytes)
                     yield decoded_bytes
                     hash.update(decoded_bytes)
-                    self.manager.send_message(
-                        decode.Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(decoded_bytes),
-                            final_bytes=len(decoded_bytes),
-                            complete=False,
-                        )
-                    )
+                    progress.add(len(decoded_bytes))
                 decoded_bytes, remaining_bytes = decoder.finish()
                 if len(decoded_bytes) > 0:
                     yield decoded_bytes
                     hash.update(decoded_bytes)
-                    self.manager.send_message(
-                        decode.Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(decoded_bytes),
-                            final_bytes=len(decoded_bytes),
-                            complete=False,
-                        )
-                    )
+                    progress.add(len(decoded_bytes))
+                progress.flush()
                 if len(remaining_bytes) > 0:
                     raise decode.RemainingBytesError(word_size, remaining_bytes)
             digest = hash.hexdigest()
@@ -330,31 +314,26 @@ class File(Path):
                 )
                 download.run(session=self.session, manager=self.manager)
                 assert download.response is not None
+                download_progress = task.ProgressBuffer(
+                    manager=self.manager,
+                    progress_type=remote.Progress,
+                    path_id=self.path_id,
+                )
+                decode_progress = task.ProgressBuffer(
+                    manager=self.manager,
+                    progress_type=decode.Progress,
+                    path_id=self.path_id,
+                )
                 for encoded_bytes in download.response.iter_content(
                     constants.CHUNK_SIZE
                 ):
                     download_hash.update(encoded_bytes)
-                    self.manager.send_message(
-                        remote.Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(encoded_bytes),
-                            final_bytes=len(encoded_bytes),
-                            complete=False,
-                        )
-                    )
+                    download_progress.add(len(encoded_bytes))
                     decoded_bytes = decoder.decompress(encoded_bytes)
                     yield decoded_bytes
                     decode_hash.update(decoded_bytes)
-                    self.manager.send_message(
-                        decode.Progress(
-                            path_id=self.path_id,
-                            initial_bytes=0,
-                            current_bytes=len(decoded_bytes),
-                            final_bytes=len(decoded_bytes),
-                            complete=False,
-                        )
-                    )
+                    decode_progress.add(len(decoded_bytes))
+                download_progress.flush()
                 download.response.close()
             download_digest = download_hash.hexdigest()
             if download_digest != self.best_compression.hash:
@@ -374,15 +353,8 @@ class File(Path):
             if len(decoded_bytes) > 0:
                 yield decoded_bytes
                 decode_hash.update(decoded_bytes)
-                self.manager.send_message(
-                    decode.Progress(
-                        path_id=self.path_id,
-                        initial_bytes=0,
-                        current_bytes=len(decoded_bytes),
-                        final_bytes=len(decoded_bytes),
-                        complete=False,
-                    )
-                )
+                decode_progress.add(len(decoded_bytes))
+            decode_progress.flush()
             if len(remaining_bytes) > 0:
                 raise decode.RemainingBytesError(word_size, remaining_bytes)
             decode_digest = decode_hash.hexdigest()
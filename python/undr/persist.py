@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import collections
 import dataclasses
+import hashlib
 import os
 import pathlib
 import sqlite3
@@ -12,6 +13,109 @@ import time
 import types
 import typing
 
+from . import constants
+
+PRAGMAS: tuple[str, ...] = (
+    "pragma journal_mode=wal",
+    "pragma synchronous=normal",
+    "pragma temp_store=memory",
+    "pragma mmap_size=268435456",
+    "pragma cache_size=-65536",
+)
+"""SQLite settings applied to every store connection.
+
+Write-ahead logging with normal synchronisation replaces the fsync on every commit with appends to the log, and lets readers in other processes query the database while the writer thread commits. The page cache (64 MiB) and memory map (256 MiB) keep the index of completed IDs in memory.
+"""
+
+CREATE_TABLE_SQL: str = "create table complete (hash blob primary key) without rowid"
+"""Creates the table of processed IDs, which stores their hashes (see :py:func:`id_hash`).
+"""
+
+CONTAINS_SQL: str = "select 1 from complete where hash = ? limit 1"
+"""Checks whether an ID hash is in the table.
+"""
+
+LEGACY_CONTAINS_SQL: str = "select 1 from complete where id = ? limit 1"
+"""Checks whether an ID is in a table created by a previous version of UNDR (see :py:attr:`LEGACY_TABLE_COLUMNS`).
+"""
+
+INSERT_SQL: str = "insert or ignore into complete values (?)"
+"""Inserts an ID hash in the table, unless it is already there.
+"""
+
+TABLE_EXISTS_SQL: str = (
+    "select 1 from sqlite_master where type = 'table' and name = 'complete' limit 1"
+)
+"""Checks whether the table exists, without listing its columns.
+"""
+
+TABLE_INFO_SQL: str = "select name, type, pk from pragma_table_info('complete')"
+"""Lists the name, type, and primary key flag of the table's columns, to validate its format.
+"""
+
+TABLE_COLUMNS: list[tuple[str, str, int]] = [("hash", "BLOB", 1)]
+"""Expected result of :py:attr:`TABLE_INFO_SQL`.
+"""
+
+LEGACY_TABLE_COLUMNS: list[tuple[str, str, int]] = [("id", "TEXT", 1)]
+"""Result of :py:attr:`TABLE_INFO_SQL` for databases created by previous versions of UNDR, which stored IDs as text.
+"""
+
+VALIDATED_TABLES: set[tuple[str, int, int]] = set()
+"""Database files whose table has already been validated by this process, identified by path, inode, and modification time.
+
+Stores opened repeatedly (for instance in each worker of a process pool) skip the table validation if the file has not changed.
+"""
+
+VALIDATED_TABLES_LOCK = threading.Lock()
+"""Protects :py:attr:`VALIDATED_TABLES`.
+"""
+
+
+def configure(connection: sqlite3.Connection):
+    """Applies :py:attr:`PRAGMAS` to a database connection.
+
+    Args:
+        connection (sqlite3.Connection): Connection to a database file.
+    """
+    for pragma in PRAGMAS:
+        connection.execute(pragma).fetchall()
+
+
+def id_hash(id: str) -> bytes:
+    """Calculates the key that represents an ID in the database.
+
+    Fixed-size keys make the database smaller and faster to search than variable-length path IDs.
+
+    Args:
+        id (str): The ID to hash.
+
+    Returns:
+        bytes: 16 bytes BLAKE2b digest of the ID.
+    """
+    return hashlib.blake2b(id.encode(), digest_size=16).digest()
+
+
+def upgrade(cursor: sqlite3.Cursor):
+    """Converts a table created by a previous version of UNDR, with text IDs, into a table of ID hashes.
+
+    The conversion runs in a transaction and does nothing if another connection has already upgraded the table. It cannot be undone: hashes cannot be converted back to IDs and previous versions of UNDR fail to open upgraded databases. Only :py:class:`Store` calls this function.
+
+    Args:
+        cursor (sqlite3.Cursor): Cursor of a connection in autocommit mode.
+    """
+    cursor.execute("begin immediate")
+    try:
+        if cursor.execute(TABLE_INFO_SQL).fetchall() == LEGACY_TABLE_COLUMNS:
+            ids = [row[0] for row in cursor.execute("select id from complete")]
+            cursor.execute("drop table complete")
+            cursor.execute(CREATE_TABLE_SQL)
+            cursor.executemany(INSERT_SQL, ((id_hash(id),) for id in ids))
+    except:
+        cursor.execute("rollback")
+        raise
+    cursor.execute("commit")
+
 
 @dataclasses.dataclass
 class Progress:
@@ -28,26 +132,59 @@ class ReadOnlyStore:
     This store provides a method to check whether a task has been performed but it cannot be modified.
     Most users will probably prefer the writable :py:class:`Store`.
 
+    IDs are stored as fixed-size hashes (see :py:func:`id_hash`). Databases created by previous versions of UNDR, which stored IDs as text, are read as they are and never modified by this class.
+
+    The results of the last :py:attr:`undr.constants.STORE_CACHE_MAXSIZE` membership tests are cached. Opening a store does not read the table's content, hence stores remain cheap to unpickle in worker processes.
+
     Args:
         path (typing.Union[str, os.PathLike]): Path of the SQLite database file with extension ".db".
     """
 
+    UPGRADE_LEGACY_TABLE: typing.ClassVar[bool] = False
+    """Whether tables created by previous versions of UNDR are converted with :py:func:`upgrade` when the store is opened.
+    """
+
     def __init__(
         self,
         path: typing.Union[str, os.PathLike],
     ):
         self.path = pathlib.Path(path).resolve()
-        self.connection = sqlite3.connect(self.path)
+        self.connection = sqlite3.connect(self.path, isolation_level=None)
+        configure(self.connection)
         self.cursor = self.connection.cursor()
-
-        rows = [row for row in self.cursor.execute("pragma table_info(complete)")]
-        if len(rows) == 0:
-            self.cursor.execute(
-                "create table complete (id text primary key) without rowid"
-            )
-            self.connection.commit()
-        elif len(rows) != 1 or rows[0] != (0, "id", "TEXT", 1, None, 1):
-            raise Exception('the table "complete" does not have the expected format')
+        self.legacy = False
+
+        status = os.stat(self.path)
+        with VALIDATED_TABLES_LOCK:
+            validated = (
+                str(self.path),
+                status.st_ino,
+                status.st_mtime_ns,
+            ) in VALIDATED_TABLES
+        if not validated:
+            if self.cursor.execute(TABLE_EXISTS_SQL).fetchone() is None:
+                self.cursor.execute(CREATE_TABLE_SQL)
+            else:
+                rows = self.cursor.execute(TABLE_INFO_SQL).fetchall()
+                if rows == LEGACY_TABLE_COLUMNS:
+                    if self.UPGRADE_LEGACY_TABLE:
+                        upgrade(self.cursor)
+                        rows = self.cursor.execute(TABLE_INFO_SQL).fetchall()
+                    else:
+                        self.legacy = True
+                if not self.legacy and rows != TABLE_COLUMNS:
+                    raise Exception(
+                        'the table "complete" does not have the expected format'
+                    )
+            if not self.legacy:
+                status = os.stat(self.path)
+                with VALIDATED_TABLES_LOCK:
+                    VALIDATED_TABLES.add(
+                        (str(self.path), status.st_ino, status.st_mtime_ns)
+                    )
+        self.contains_cache: collections.OrderedDict[str, bool] = (
+            collections.OrderedDict()
+        )
 
     def __contains__(self, id: str):
         """Whether the given ID has been processed.
@@ -58,12 +195,40 @@ class ReadOnlyStore:
         Returns:
             bool: True if the file is in the store, which means that it has been processed.
         """
-        return (
-            self.cursor.execute(
-                "select * from complete where id == ?", (id,)
-            ).fetchone()
-            is not None
-        )
+        result = self.contains_cache.get(id)
+        if result is not None:
+            self.contains_cache.move_to_end(id)
+            return result
+        result = self._query(id=id)
+        self._cache(id=id, result=result)
+        return result
+
+    def _query(self, id: str) -> bool:
+        """Checks whether the given ID is in the database, without using the cache.
+
+        Args:
+            id (str): The ID to check.
+
+        Returns:
+            bool: True if the ID is in the database.
+        """
+        if self.legacy:
+            row = self.cursor.execute(LEGACY_CONTAINS_SQL, (id,)).fetchone()
+        else:
+            row = self.cursor.execute(CONTAINS_SQL, (id_hash(id),)).fetchone()
+        return row is not None
+
+    def _cache(self, id: str, result: bool):
+        """Records the result of a membership test, evicting the least recently used entry if the cache is full.
+
+        Args:
+            id (str): The tested ID.
+            result (bool): Whether the ID is in the store.
+        """
+        self.contains_cache[id] = result
+        self.contains_cache.move_to_end(id)
+        if len(self.contains_cache) > constants.STORE_CACHE_MAXSIZE:
+            self.contains_cache.popitem(last=False)
 
     def close(self):
         """Closes the store's database."""
@@ -103,9 +268,11 @@ class ReadOnlyStore:
 class Store(ReadOnlyStore):
     """Stores the IDs of processed tasks.
 
+    Databases created by previous versions of UNDR, which stored IDs as text, are upgraded to the hash format (see :py:func:`upgrade`) when the store is opened. The upgrade is one-way: previous versions of UNDR cannot open the database afterwards.
+
     Args:
         path (typing.Union[str, os.PathLike]): Path of the SQLite database file with extension ".db".
-        commit_maximum_delay (float, optional): How often changes are commited to the disk, in seconds. Defaults to 0.1.
+        commit_maximum_delay (float, optional): Maximum time that a change waits before being commited to the disk, in seconds. Changes that arrive in the meantime are commited together. Defaults to 0.1.
         commit_maximum_inserts (int, optional): Maximum number of changes before commiting changes to the disk. Defaults to 100.
     """
 
@@ -120,45 +287,69 @@ class Store(ReadOnlyStore):
         pass
 
     def target(self):
-        """Worker thread implementation."""
-        thread_connection = sqlite3.connect(self.path)
+        """Worker thread implementation.
+
+        The connection is in autocommit mode and each batch of inserts runs in an explicit transaction. Inserts are written when :py:attr:`commit_maximum_inserts` are pending, when the oldest pending insert is older than :py:attr:`commit_maximum_delay`, before a reset or a commit, and when the store is closed. Closing the store writes all the queued inserts before the thread exits. The thread sleeps without a timeout while no inserts are pending, and only wakes up when a message is queued or the store is closed. The thread runs "pragma optimize" before closing the connection to keep the query planner statistics up to date.
+        """
+        thread_connection = sqlite3.connect(self.path, isolation_level=None)
+        configure(thread_connection)
         cursor = thread_connection.cursor()
-        while self.running:
-            commit = False
-            for _ in range(0, self.commit_maximum_inserts):
+        pending: list[tuple[bytes]] = []
+        first_pending_time = 0.0
+
+        def insert_pending():
+            cursor.execute("begin immediate")
+            cursor.executemany(INSERT_SQL, pending)
+            cursor.execute("commit")
+            pending.clear()
+
+        while True:
+            self.wakeup.clear()
+            running = self.running
+            while len(pending) < self.commit_maximum_inserts:
                 try:
                     message = self.queue.popleft()
-                    if isinstance(message, Store.Reset):
-                        rows = [
-                            row for row in cursor.execute("pragma table_info(complete)")
-                        ]
-                        if len(rows) != 1 or rows[0] != (0, "id", "TEXT", 1, None, 1):
-                            raise Exception(
-                                'the table "complete" does not have the expected format'
-                            )
-                        cursor.executescript(
-                            "drop table if exists complete; create table complete (id text primary key) without rowid;"
-                        )
-                        thread_connection.commit()
-                        commit = False
-                    elif isinstance(message, Store.Commit):
-                        thread_connection.commit()
-                        self.commit_barrier.wait()
-                        commit = False
-                    else:
-                        cursor.execute(
-                            "insert or ignore into complete values (?)", (message,)
-                        )
-                        commit = True
                 except IndexError:
                     break
-            if commit:
-                thread_connection.commit()
-            else:
-                time.sleep(self.commit_maximum_delay)
+                if not isinstance(message, (Store.Reset, Store.Commit)):
+                    if len(pending) == 0:
+                        first_pending_time = time.monotonic()
+                    pending.append((message,))
+                    continue
+                if len(pending) > 0:
+                    insert_pending()
+                if isinstance(message, Store.Reset):
+                    if cursor.execute(TABLE_INFO_SQL).fetchall() != TABLE_COLUMNS:
+                        raise Exception(
+                            'the table "complete" does not have the expected format'
+                        )
+                    cursor.executescript(
+                        f"begin immediate; drop table if exists complete; {CREATE_TABLE_SQL}; commit;"
+                    )
+                    self.resets_applied += 1
+                else:
+                    self.commit_done.set()
+            delay: typing.Optional[float] = None
+            if len(pending) > 0:
+                delay = self.commit_maximum_delay - (
+                    time.monotonic() - first_pending_time
+                )
+                if (
+                    not running
+                    or len(pending) >= self.commit_maximum_inserts
+                    or delay <= 0.0
+                ):
+                    insert_pending()
+                    continue
+            elif not running:
+                break
+            self.wakeup.wait(delay)
+        cursor.execute("pragma optimize")
         cursor.close()
         thread_connection.close()
 
+    UPGRADE_LEGACY_TABLE = True
+
     def __init__(
         self,
         path: typing.Union[str, os.PathLike],
@@ -169,35 +360,79 @@ class Store(ReadOnlyStore):
         self.commit_maximum_delay = commit_maximum_delay
         self.commit_maximum_inserts = commit_maximum_inserts
         self.queue: collections.deque[
-            typing.Union[str, Store.Reset, Store.Commit]
+            typing.Union[bytes, Store.Reset, Store.Commit]
         ] = collections.deque()
         self.running = True
+        self.wakeup = threading.Event()
+        self.commit_done = threading.Event()
+        self.resets_requested = 0
+        self.resets_applied = 0
         self.thread = threading.Thread(target=self.target, daemon=True)
         self.thread.start()
-        self.commit_barrier = threading.Barrier(2)
 
     def add(self, id: str):
         """Adds a row to the database.
 
-        The action is ignored if the entry is already in the database.
+        The action is ignored if the entry is already in the database. The ID is immediately visible to membership tests on this store, even before the change is commited.
 
         Args:
             id (str): Entry to store in the database.
         """
-        self.queue.append(id)
+        self._cache(id=id, result=True)
+        self.queue.append(id_hash(id))
+        self.wakeup.set()
+
+    def add_many(self, ids: typing.Iterable[str]):
+        """Adds rows to the database.
+
+        This is equivalent to calling :py:meth:`add` for each ID, but the IDs are queued at once.
+
+        Args:
+            ids (typing.Iterable[str]): Entries to store in the database.
+        """
+        hashes = []
+        for id in ids:
+            self._cache(id=id, result=True)
+            hashes.append(id_hash(id))
+        self.queue.extend(hashes)
+        self.wakeup.set()
+
+    def __contains__(self, id: str):
+        """Whether the given ID has been processed.
+
+        Lookups are not cached while a :py:meth:`reset` waits for the worker thread, since the database may still contain the entries that the reset drops.
+
+        Args:
+            id (str): The ID to check.
+
+        Returns:
+            bool: True if the file is in the store, which means that it has been processed.
+        """
+        if self.resets_applied == self.resets_requested:
+            return super().__contains__(id)
+        result = self.contains_cache.get(id)
+        if result is not None:
+            return result
+        return self._query(id=id)
 
     def reset(self):
         """Drops all entries from the database."""
+        self.contains_cache.clear()
+        self.resets_requested += 1
         self.queue.append(Store.Reset())
+        self.wakeup.set()
 
     def commit(self):
         """Immediately persists changes to the disk."""
+        self.commit_done.clear()
         self.queue.append(Store.Commit())
-        self.commit_barrier.wait()
+        self.wakeup.set()
+        self.commit_done.wait()
 
     def close(self):
         """Closes the store's database."""
         self.running = False
+        self.wakeup.set()
         self.thread.join()
         super().close()
 
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import functools
+import os
+import typing
+
 import numpy
 
 DVS_DTYPE: numpy.dtype = numpy.dtype(
@@ -18,6 +22,7 @@ Each event uses 13 bytes, with no padding between events. The fields are packed
 """
 
 
+@functools.lru_cache(maxsize=32)
 def aps_dtype(width: int, height: int) -> numpy.dtype:
     """Data type for APS files.
 
@@ -52,6 +57,59 @@ def aps_dtype(width: int, height: int) -> numpy.dtype:
     )
 
 
+def split_fields(
+    packet: numpy.ndarray, fields: typing.Optional[typing.Iterable[str]] = None
+) -> dict[str, numpy.ndarray]:
+    """Copies the fields of a structured array into contiguous arrays.
+
+    Fields of a structured array are strided views into its records. Numpy kernels that read a field several times (for instance ``t[1:] < t[:-1]``) are faster on contiguous arrays, which are cheaper to iterate and vectorise better. The gain is largest for formats with large records, such as APS frames.
+
+    Args:
+        packet (numpy.ndarray): Structured array, typically yielded by a file's ``packets`` method.
+        fields (typing.Optional[typing.Iterable[str]], optional): Names of the fields to copy. All the fields are copied if this is None. Defaults to None.
+
+    Returns:
+        dict[str, numpy.ndarray]: Contiguous copy of each requested field, indexed by field name.
+    """
+    if fields is None:
+        fields = packet.dtype.names
+    return {field: numpy.ascontiguousarray(packet[field]) for field in fields}  # type: ignore
+
+
+def aps_load(
+    buffer: typing.Union[bytes, bytearray, memoryview], width: int, height: int
+) -> dict[str, numpy.ndarray]:
+    """Parses APS frames into one contiguous array per field (see :py:func:`split_fields`).
+
+    Args:
+        buffer (typing.Union[bytes, bytearray, memoryview]): Raw frames. Its size must be a multiple of the frame size.
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+
+    Returns:
+        dict[str, numpy.ndarray]: Contiguous array for each field of :py:func:`aps_dtype`, indexed by field name. The ``pixels`` array has the shape ``(frames, width, height)``.
+    """
+    return split_fields(numpy.frombuffer(buffer, dtype=aps_dtype(width, height)))
+
+
+def aps_frames_view(
+    buffer: typing.Union[bytes, bytearray, memoryview], width: int, height: int
+) -> numpy.ndarray:
+    """Returns the pixels of APS frames without copying them.
+
+    Unlike :py:func:`aps_load`, this function does not copy the data. The pixels of each frame are contiguous in memory, hence per-frame operations (for instance ``pixels.mean(axis=(1, 2))``) read contiguous memory and skip the frame headers.
+
+    Args:
+        buffer (typing.Union[bytes, bytearray, memoryview]): Raw frames. Its size must be a multiple of the frame size.
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+
+    Returns:
+        numpy.ndarray: View with shape ``(frames, width, height)`` and dtype ``<u2``. The view is read-only if the buffer is read-only (for instance bytes).
+    """
+    return numpy.frombuffer(buffer, dtype=aps_dtype(width, height))["pixels"]
+
+
 IMU_DTYPE: numpy.dtype = numpy.dtype(
     [
         ("t", "<u8"),
@@ -83,3 +141,67 @@ Each IMU sample uses 48 bytes, with no padding between samples. Fields that are
 - ``magnetometer_y``: single-precision floating point number (IEEE 754) (y-axis angular position in AEDAT4 doc?)
 - ``magnetometer_z``: single-precision floating point number (IEEE 754) (z-axis angular position in AEDAT4 doc?)
 """
+
+
+def memory_map(
+    path: typing.Union[str, os.PathLike], dtype: numpy.dtype
+) -> numpy.ndarray:
+    """Maps an uncompressed file in memory as a read-only array, without reading it.
+
+    The operating system loads pages on demand as the array is accessed, hence large files do not need to fit in memory. The mapping is released when the array and all the views derived from it are garbage-collected.
+
+    Args:
+        path (typing.Union[str, os.PathLike]): Path of the raw file.
+        dtype (numpy.dtype): The file's data type, for instance :py:attr:`DVS_DTYPE`.
+
+    Raises:
+        ValueError: if the file size is not a multiple of the data type size.
+
+    Returns:
+        numpy.ndarray: Read-only structured array backed by the file.
+    """
+    if os.stat(path).st_size == 0:
+        array = numpy.zeros(0, dtype=dtype)
+        array.flags.writeable = False
+        return array
+    return numpy.memmap(path, dtype=dtype, mode="r")
+
+
+def aps_mmap(
+    path: typing.Union[str, os.PathLike], width: int, height: int
+) -> numpy.ndarray:
+    """Maps an uncompressed APS file in memory (see :py:func:`memory_map`).
+
+    Args:
+        path (typing.Union[str, os.PathLike]): Path of the APS file.
+        width (int): Frame width in pixels.
+        height (int): Frame height in pixels.
+
+    Returns:
+        numpy.ndarray: Read-only array with dtype :py:func:`aps_dtype`.
+    """
+    return memory_map(path=path, dtype=aps_dtype(width, height))
+
+
+def dvs_mmap(path: typing.Union[str, os.PathLike]) -> numpy.ndarray:
+    """Maps an uncompressed DVS file in memory (see :py:func:`memory_map`).
+
+    Args:
+        path (typing.Union[str, os.PathLike]): Path of the DVS file.
+
+    Returns:
+        numpy.ndarray: Read-only array with dtype :py:attr:`DVS_DTYPE`.
+    """
+    return memory_map(path=path, dtype=DVS_DTYPE)
+
+
+def imu_mmap(path: typing.Union[str, os.PathLike]) -> numpy.ndarray:
+    """Maps an uncompressed IMU file in memory (see :py:func:`memory_map`).
+
+    Args:
+        path (typing.Union[str, os.PathLike]): Path of the IMU file.
+
+    Returns:
+        numpy.ndarray: Read-only array with dtype :py:attr:`IMU_DTYPE`.
+    """
+    return memory_map(path=path, dtype=IMU_DTYPE)
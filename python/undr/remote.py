@@ -264,12 +264,10 @@ class DownloadFile(Download):
             if self.expected_hash is not None:
                 self.hash = utilities.new_hash()
             return 0
-        if file_path.is_file():
-            size = (
-                file_path.stat().st_size
-                if self.expected_size is None
-                else self.expected_size
-            )
+        size = utilities.file_size(file_path)
+        if size is not None:
+            if self.expected_size is not None:
+                size = self.expected_size
             manager.send_message(
                 Progress(
                     path_id=self.path_id,
@@ -280,13 +278,13 @@ class DownloadFile(Download):
                 )
             )
             return -1
-        if download_path.is_file():
+        size = utilities.file_size(download_path)
+        if size is not None:
             if self.expected_hash is not None:
                 self.hash = utilities.hash_file(
                     path=download_path, chunk_size=constants.CHUNK_SIZE
                 )
             self.stream = open(download_path, "ab")
-            size = download_path.stat().st_size
             manager.send_message(
                 Progress(
                     path_id=self.path_id,
@@ -340,20 +338,15 @@ class DownloadFile(Download):
             manager (task.Manager): The task manager for reporting updates.
         """
         assert self.stream is not None
+        progress = task.ProgressBuffer(
+            manager=manager, progress_type=Progress, path_id=self.path_id
+        )
         for chunk in response.iter_content(constants.CHUNK_SIZE):
             self.stream.write(chunk)
             if self.hash is not None:
                 self.hash.update(chunk)
-            size = len(chunk)
-            manager.send_message(
-                Progress(
-                    path_id=self.path_id,
-                    initial_bytes=0,
-                    current_bytes=size,
-                    final_bytes=size,
-                    complete=False,
-                )
-            )
+            progress.add(len(chunk))
+        progress.flush()
         response.close()
         self.on_end(manager=manager)
 
@@ -3,14 +3,18 @@
 from __future__ import annotations
 
 import collections
+import copy
 import enum
+import io
 import logging
 import multiprocessing
 import pathlib
 import pickle
+import selectors
+import shutil
 import socket
-import socketserver
 import struct
+import tempfile
 import threading
 import time
 import traceback
@@ -21,6 +25,12 @@ import requests
 
 from . import constants
 
+HEADER = struct.Struct("<cQ")
+"""Encoder and decoder for message headers (type byte and little-endian message size).
+
+See :py:func:`send_type` for a description of type encoding.
+"""
+
 
 class Task:
     """A processing task to be performed by a worker."""
@@ -47,6 +57,31 @@ class Chain(Task):
             task.run(session=session, manager=manager)
 
 
+class Batch(Task):
+    """A sequence of independent tasks that run sequentially in a single worker.
+
+    Unlike :py:class:`Chain`, an exception raised by a task does not prevent the next tasks from running. Each exception is sent to the manager as a :py:class:`WorkerException`, as if the tasks had been scheduled separately.
+
+    Args:
+        Task (typing.Sequence[Task]): The list of tasks to run in the given order.
+    """
+
+    def __init__(self, tasks: typing.Sequence[Task]):
+        self.tasks = tasks
+
+    def run(self, session: requests.Session, manager: "Manager"):
+        for task in self.tasks:
+            try:
+                task.run(session=session, manager=manager)
+            except Exception as exception:
+                logging.debug(exception)
+                manager.send_message(
+                    WorkerException(
+                        traceback.TracebackException.from_exception(exception)
+                    )
+                )
+
+
 class Manager:
     """Schedules and keeps track of tasks.
 
@@ -87,6 +122,62 @@ class NullManager(Manager):
         pass
 
 
+class ProgressBuffer:
+    """Accumulates byte counts and sends them to a manager as fewer, larger progress messages.
+
+    Args:
+        manager (Manager): The manager that receives the progress messages.
+        progress_type (typing.Callable[..., typing.Any]): Progress message class, for instance :py:class:`undr.decode.Progress` or :py:class:`undr.remote.Progress`.
+        path_id (pathlib.PurePosixPath): Identifier of the resource.
+        threshold (int, optional): Number of accumulated bytes that triggers a message. Defaults to :py:attr:`undr.constants.PROGRESS_THRESHOLD`.
+        maximum_delay (float, optional): Time in seconds after which accumulated bytes are sent even if the threshold is not reached. Defaults to :py:attr:`undr.constants.PROGRESS_MAXIMUM_DELAY`.
+    """
+
+    def __init__(
+        self,
+        manager: Manager,
+        progress_type: typing.Callable[..., typing.Any],
+        path_id: pathlib.PurePosixPath,
+        threshold: int = constants.PROGRESS_THRESHOLD,
+        maximum_delay: float = constants.PROGRESS_MAXIMUM_DELAY,
+    ):
+        self.manager = manager
+        self.progress_type = progress_type
+        self.path_id = path_id
+        self.threshold = threshold
+        self.maximum_delay = maximum_delay
+        self.pending_bytes = 0
+        self.last_flush = time.monotonic()
+
+    def add(self, size: int):
+        """Accumulates bytes and sends a progress message if the threshold or the maximum delay is reached.
+
+        Args:
+            size (int): Number of bytes read or decompressed since the last call.
+        """
+        self.pending_bytes += size
+        if (
+            self.pending_bytes >= self.threshold
+            or time.monotonic() - self.last_flush >= self.maximum_delay
+        ):
+            self.flush()
+
+    def flush(self):
+        """Sends a progress message for the accumulated bytes, if any."""
+        if self.pending_bytes > 0:
+            self.manager.send_message(
+                self.progress_type(
+                    path_id=self.path_id,
+                    initial_bytes=0,
+                    current_bytes=self.pending_bytes,
+                    final_bytes=self.pending_bytes,
+                    complete=False,
+                )
+            )
+            self.pending_bytes = 0
+        self.last_flush = time.monotonic()
+
+
 class WorkerException(Exception):
     """An exception wrapper than can be sent across threads.
 
@@ -115,11 +206,11 @@ def send_bytes(client: socket.socket, type: bytes, message: bytes):
     This message encoding scheme is used internally by :py:class:`ProcessManager`.
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
         type (bytes): Encoded type bytes. See :py:func:`send_bytes` for a description of type encoding.
         message (bytes): Pickled message bytes.
     """
-    client.sendall(struct.pack("<cQ", type, len(message)) + message)
+    client.sendall(HEADER.pack(type, len(message)) + message)
 
 
 def send_message(client: socket.socket, type: bytes, message: typing.Any):
@@ -128,7 +219,7 @@ def send_message(client: socket.socket, type: bytes, message: typing.Any):
     This message encoding scheme is used internally by :py:class:`ProcessManager`.
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
         type (bytes): Encoded type bytes. See :py:func:`send_bytes` for a description of type encoding.
         message (typing.Any): Any object compatible with the :py:mod:`pickle` module.
     """
@@ -154,19 +245,19 @@ def send_type(client: socket.socket, type: bytes):
     - ``b"s"``: Acknowledges a task message (message to worker ``>= 0x80``  request).
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
         type (bytes): Encoded type bytes.
     """
-    client.sendall(struct.pack("<cQ", type, 0))
+    client.sendall(HEADER.pack(type, 0))
 
 
 def receive_message(
     client: socket.socket, unpickle: bool = True
 ) -> tuple[bytes, typing.Any]:
-    """Reads TCP bytes until enough are received to generate a full a type and message.
+    """Reads bytes until enough are received to generate a full a type and message.
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
         unpickle (bool, optional): Whether to pass the message bytes to :py:func:`pickle.loads`. Defaults to True.
 
     Returns:
@@ -175,13 +266,13 @@ def receive_message(
     header: bytes = b""
     while True:
         length = len(header)
-        header += client.recv(9 - length)
+        header += client.recv(HEADER.size - length)
         new_length = len(header)
         if new_length == length:
             raise ConnectionResetError()
-        if new_length == 9:
+        if new_length == HEADER.size:
             break
-    type, size = struct.unpack("<cQ", header)
+    type, size = HEADER.unpack(header)
     if size == 0:
         return type, b""
     message = bytearray(size)
@@ -195,10 +286,10 @@ def receive_message(
 
 
 def receive_bytes(client: socket.socket) -> tuple[bytes, bytes]:
-    """Reads TCP bytes until enough are received to generate a full a type and a raw message.
+    """Reads bytes until enough are received to generate a full a type and a raw message.
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
 
     Returns:
         tuple[bytes, bytes]: The type's bytes and the raw message's bytes.
@@ -207,10 +298,10 @@ def receive_bytes(client: socket.socket) -> tuple[bytes, bytes]:
 
 
 def receive_type(client: socket.socket, expected_type: bytes):
-    """Reads TCP bytes bytes until an acknowledge type is received.
+    """Reads bytes until an acknowledge type is received.
 
     Args:
-        client (socket.socket): TCP client used to send messages between workers and the manager.
+        client (socket.socket): Socket client used to send messages between workers and the manager.
         expected_type (bytes): The execpted acknowledge type.
     """
     type, message = receive_message(client=client, unpickle=False)
@@ -225,9 +316,10 @@ class ProcessManager(Manager):
     Whenever a worker is idle, the manager scans its (the manager's) task queues in order of priority until it finds a non-empty queue, and sends the first task from that queue to the worker. Hence, tasks with lower priorities are scheduled first. However, since a task may asynchronously spawn more tasks with arbitrary priority levels, there is no guarantee that all tasks with priority 0 spawned by a program overall are executed before all tasks with priority 1. In particular, tasks are never cancelled, even if a task with a lower priority level (i.e. more urgent) becomes available while a worker is already running a task with a higher priority level (i.e. less urgent).
 
     Args:
-        workers (int, optional): Number of parallel workers (threads). Defaults to twice :py:func:`multiprocessing.cpu_count`.
+        workers (int, optional): Number of parallel workers (processes). Defaults to twice :py:func:`multiprocessing.cpu_count`.
         priority_levels (int, optional): Number of priority queues. Defaults to 2.
         log_directory (typing.Optional[pathlib.Path], optional): Directory to store log files. Logs are not generated if this is None. Defaults to None.
+        threads_per_worker (int, optional): Number of task threads in each worker process. Threads share the process's memory and are cheaper than processes, which helps I/O-bound tasks (downloads) whereas CPU-bound tasks (decompression, decoding) require more processes. Defaults to 1.
     """
 
     class ClosePolicy(enum.Enum):
@@ -254,35 +346,64 @@ class ProcessManager(Manager):
     class Proxy(Manager):
         """Manager interface that can be sent to workers.
 
-        Since :py:class:`ProcessManager` implements a custom message passing system and owns message queues, it cannot be shared between processes. Worker processes require a handle to the manager to send messages and schedule new tasks. However, the handle does not have to be the actual manager, it is merely a means to pass around the two fuctions of its public API. This proxy prentends to be the manager but forwards messages to the actual manager using TCP. See :py:func:`send_bytes` for a description of message encoding.
+        Since :py:class:`ProcessManager` implements a custom message passing system and owns message queues, it cannot be shared between processes. Worker processes require a handle to the manager to send messages and schedule new tasks. However, the handle does not have to be the actual manager, it is merely a means to pass around the two fuctions of its public API. This proxy prentends to be the manager but forwards messages to the actual manager using a Unix domain socket (or TCP on platforms that do not support them). See :py:func:`send_bytes` for a description of message encoding.
 
         Args:
-            server_port (int): Port of the manager's TCP server used to send messages between workers and the manager.
+            server_family (socket.AddressFamily): Address family of the manager's server, :py:data:`socket.AF_UNIX` or :py:data:`socket.AF_INET`.
+            server_address (typing.Union[str, tuple[str, int]]): Address of the manager's server used to send messages between workers and the manager, a socket path for Unix domain sockets and a (host, port) tuple for TCP.
         """
 
-        def __init__(self, server_port: int):
-            self.server_port = server_port
+        def __init__(
+            self,
+            server_family: socket.AddressFamily,
+            server_address: typing.Union[str, tuple[str, int]],
+        ):
+            self.server_family = server_family
+            self.server_address = server_address
             self.client: typing.Optional[socket.socket] = None
+            self.buffer: typing.Optional[io.BytesIO] = None
+            self.pickler: typing.Optional[pickle.Pickler] = None
 
         def setup(self):
-            """Called by each worker to create the TCP connection with the actual manager."""
-            self.client = socket.create_connection(
-                address=("localhost", self.server_port)
+            """Called by each worker to create the connection with the actual manager."""
+            self.client = socket.socket(
+                family=self.server_family, type=socket.SOCK_STREAM
             )
+            self.client.connect(self.server_address)
+            self.buffer = io.BytesIO()
+            self.pickler = pickle.Pickler(self.buffer)
+
+        def dumps(self, message: typing.Any) -> bytes:
+            """Pickles a message with the worker's persistent pickler.
+
+            The pickler and its buffer are reused for all the messages sent by the worker, and the memo is cleared between messages.
+
+            Args:
+                message (typing.Any): Any object compatible with the :py:mod:`pickle` module.
+
+            Returns:
+                bytes: Pickled message bytes.
+            """
+            assert self.buffer is not None and self.pickler is not None
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.pickler.clear_memo()
+            self.pickler.dump(message)
+            return self.buffer.getvalue()
 
         def schedule(self, task: Task, priority: int = 1):
             logging.debug(f"schedule {task} with priority {priority}")
             assert self.client is not None
-            send_message(
+            send_bytes(
                 client=self.client,
                 type=(128 + priority).to_bytes(1, byteorder="little"),
-                message=task,
+                message=self.dumps(task),
             )
             receive_type(client=self.client, expected_type=b"s")
 
         def send_message(self, message: typing.Any):
             assert self.client is not None
-            send_message(client=self.client, type=b"m", message=message)
+            send_bytes(client=self.client, type=b"m", message=self.dumps(message))
             receive_type(client=self.client, expected_type=b"m")
 
         def next_task(
@@ -312,19 +433,47 @@ class ProcessManager(Manager):
             return message
 
     def serve(self):
-        """Server thread implementation."""
-        self.server.serve_forever(poll_interval=0.1)
+        """Server thread implementation.
+
+        A single thread multiplexes all the worker connections with a selector. Incoming bytes are accumulated in per-connection buffers and parsed into requests, responses are written without blocking and buffered until the socket is writable.
+        """
+        while self.serving:
+            for key, events in self.selector.select(timeout=0.1):
+                if key.data is None:
+                    self.accept()
+                    continue
+                connection: ProcessManager.Connection = key.data
+                try:
+                    if events & selectors.EVENT_READ:
+                        self.read(connection)
+                    if events & selectors.EVENT_WRITE:
+                        self.write(connection)
+                except ConnectionError:
+                    self.disconnect(connection)
+                except Exception:
+                    traceback.print_exc()
+                    self.disconnect(connection)
+        for key in list(self.selector.get_map().values()):
+            if key.data is not None:
+                self.disconnect(key.data)
+        self.selector.unregister(self.listener)
+        self.selector.close()
+        self.listener.close()
+        if self.socket_directory is not None:
+            shutil.rmtree(self.socket_directory, ignore_errors=True)
 
     @staticmethod
     def target(
         proxy: "ProcessManager.Proxy",
         log_directory: typing.Optional[pathlib.Path],
+        threads_per_worker: int = 1,
     ):
-        """Worker thread implementation.
+        """Worker process implementation.
 
         Args:
             proxy (ProcessManager.Proxy): The manager proxy to request tasks, spawn new tasks, and send messages.
             log_directory (typing.Optional[pathlib.Path]): Directory to store log files. Logs are not generated if this is None.
+            threads_per_worker (int, optional): Number of task threads in this worker process. Each thread uses its own copy of the proxy (and connection). Defaults to 1.
         """
         try:
             if log_directory is not None:
@@ -337,6 +486,32 @@ class ProcessManager(Manager):
                     format="%(asctime)s %(message)s",
                 )
             logging.debug("start worker")
+            if threads_per_worker == 1:
+                ProcessManager.thread_target(proxy=proxy)
+            else:
+                threads = tuple(
+                    threading.Thread(
+                        target=ProcessManager.thread_target,
+                        args=(copy.copy(proxy),),
+                        daemon=True,
+                    )
+                    for _ in range(0, threads_per_worker)
+                )
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        except KeyboardInterrupt:
+            pass
+
+    @staticmethod
+    def thread_target(proxy: "ProcessManager.Proxy"):
+        """Worker thread implementation.
+
+        Args:
+            proxy (ProcessManager.Proxy): The manager proxy to request tasks, spawn new tasks, and send messages. It must not be shared with other threads.
+        """
+        try:
             proxy.setup()
             logging.debug("connected to message server")
             with requests.Session() as session:
@@ -360,9 +535,6 @@ class ProcessManager(Manager):
                             )
                         )
                     active_task = proxy.acknowledge_and_next_task()
-
-        except KeyboardInterrupt:
-            pass
         except ConnectionResetError:
             pass
 
@@ -371,8 +543,10 @@ class ProcessManager(Manager):
         workers: int = multiprocessing.cpu_count() * 2,
         priority_levels: int = 2,
         log_directory: typing.Optional[pathlib.Path] = None,
+        threads_per_worker: int = 1,
     ):
         assert workers > 0
+        assert threads_per_worker > 0
         assert priority_levels > 0 and priority_levels < 128
         self.running = True
         self.message_queue: collections.deque[typing.Any] = collections.deque()
@@ -381,14 +555,26 @@ class ProcessManager(Manager):
         )
         self.tasks_left_lock = threading.Lock()
         self.tasks_left = 0
-        self.server = socketserver.ThreadingTCPServer(
-            server_address=("localhost", 0),
-            RequestHandlerClass=ProcessManager.RequestHandler,
-        )
-        self.server.daemon_threads = True
-        self.server.manager = self  # type: ignore
+        self.message_available = threading.Condition(self.tasks_left_lock)
+        self.socket_directory: typing.Optional[pathlib.Path] = None
+        if hasattr(socket, "AF_UNIX"):
+            self.socket_directory = pathlib.Path(tempfile.mkdtemp(prefix="undr-"))
+            self.listener = socket.socket(
+                family=socket.AF_UNIX, type=socket.SOCK_STREAM
+            )
+            self.listener.bind(str(self.socket_directory / "manager.sock"))
+        else:
+            self.listener = socket.socket(
+                family=socket.AF_INET, type=socket.SOCK_STREAM
+            )
+            self.listener.bind(("localhost", 0))
+        self.listener.listen(workers * threads_per_worker)
+        self.listener.setblocking(False)
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.listener, selectors.EVENT_READ, data=None)
+        self.serving = True
         logging.debug(
-            f"communnication server listening on port {self.server.server_address[1]}"
+            f"communnication server listening on {self.listener.getsockname()}"
         )
         self.serve_thread = threading.Thread(target=self.serve, daemon=True)
         self.serve_thread.start()
@@ -397,8 +583,12 @@ class ProcessManager(Manager):
                 target=ProcessManager.target,
                 daemon=True,
                 args=(
-                    ProcessManager.Proxy(server_port=self.server.server_address[1]),
+                    ProcessManager.Proxy(
+                        server_family=self.listener.family,
+                        server_address=self.listener.getsockname(),
+                    ),
                     log_directory,
+                    threads_per_worker,
                 ),
             )
             for _ in range(0, workers)
@@ -407,56 +597,151 @@ class ProcessManager(Manager):
         for worker in self.workers:
             worker.start()
 
-    class RequestHandler(socketserver.BaseRequestHandler):
-        """Processes TCP requests for the actual manager (TCP server)."""
+    class Connection:
+        """State of a worker connection, owned by the server thread.
 
-        def handle(self):
-            """Processes a TCP request.
+        Args:
+            client (socket.socket): Non-blocking socket connected to a worker.
+        """
 
-            See :py:func:`send_bytes` for a description of message encoding.
-            """
-            logging.debug("start request handler")
+        def __init__(self, client: socket.socket):
+            self.client = client
+            self.input = bytearray()
+            self.output = bytearray()
+            self.writing = False
+
+    def accept(self):
+        """Accepts a worker connection and registers it with the selector."""
+        client, _ = self.listener.accept()
+        client.setblocking(False)
+        self.selector.register(
+            client,
+            selectors.EVENT_READ,
+            data=ProcessManager.Connection(client=client),
+        )
+        logging.debug("start request handler")
+
+    def disconnect(self, connection: "ProcessManager.Connection"):
+        """Unregisters and closes a worker connection.
+
+        Args:
+            connection (ProcessManager.Connection): The connection to close.
+        """
+        self.selector.unregister(connection.client)
+        connection.client.close()
+
+    def read(self, connection: "ProcessManager.Connection"):
+        """Reads available bytes from a worker and processes complete requests.
+
+        Args:
+            connection (ProcessManager.Connection): The connection that is ready for reading.
+        """
+        try:
+            data = connection.client.recv(65536)
+        except BlockingIOError:
+            return
+        if len(data) == 0:
+            raise ConnectionResetError()
+        connection.input += data
+        while len(connection.input) >= HEADER.size:
+            type, size = HEADER.unpack_from(connection.input)
+            if len(connection.input) < HEADER.size + size:
+                break
+            message = bytes(connection.input[HEADER.size : HEADER.size + size])
+            del connection.input[: HEADER.size + size]
+            self.handle(connection=connection, type=type, message=message)
+        self.write(connection)
+
+    def write(self, connection: "ProcessManager.Connection"):
+        """Sends buffered response bytes without blocking.
+
+        The connection is registered for write events as long as its output buffer is not empty.
+
+        Args:
+            connection (ProcessManager.Connection): The connection that is ready for writing.
+        """
+        if len(connection.output) > 0:
             try:
-                manager: ProcessManager = self.server.manager  # type: ignore
-                while True:
-                    type, message = receive_bytes(client=self.request)
-                    if type == b"n" or type == b"t":
-                        assert message == b""
-                        if type == b"t":
-                            with manager.tasks_left_lock:
-                                manager.tasks_left -= 1
-                        if manager.running:
-                            task: typing.Optional[bytes] = None
-                            for task_queue in manager.task_queues:
-                                try:
-                                    task = task_queue.popleft()
-                                    break
-                                except IndexError:
-                                    continue
-                            if task is None:
-                                send_message(
-                                    client=self.request, type=b"t", message=None
-                                )
-                            else:
-                                send_bytes(client=self.request, type=b"t", message=task)
-                        else:
-                            send_message(
-                                client=self.request, type=b"t", message=CloseRequest()
-                            )
-                    elif type == b"m":
-                        manager.message_queue.append(pickle.loads(message))
-                        send_type(client=self.request, type=b"m")
-                    elif type >= b"\x80":
-                        manager.task_queues[
-                            int.from_bytes(type, byteorder="little") - 128
-                        ].append(message)
-                        with manager.tasks_left_lock:
-                            manager.tasks_left += 1
-                        send_type(client=self.request, type=b"s")
-                    else:
-                        raise Exception(f'unexpected request type "{type}"')
-            except ConnectionResetError:
-                pass
+                sent = connection.client.send(connection.output)
+            except BlockingIOError:
+                sent = 0
+            del connection.output[:sent]
+        writing = len(connection.output) > 0
+        if writing != connection.writing:
+            connection.writing = writing
+            self.selector.modify(
+                connection.client,
+                selectors.EVENT_READ | selectors.EVENT_WRITE
+                if writing
+                else selectors.EVENT_READ,
+                data=connection,
+            )
+
+    def respond(
+        self, connection: "ProcessManager.Connection", type: bytes, message: bytes
+    ):
+        """Queues a response in the connection's output buffer.
+
+        Args:
+            connection (ProcessManager.Connection): The connection to the worker that sent the request.
+            type (bytes): Encoded type bytes. See :py:func:`send_bytes` for a description of type encoding.
+            message (bytes): Pickled message bytes.
+        """
+        connection.output += HEADER.pack(type, len(message))
+        connection.output += message
+
+    def handle(
+        self, connection: "ProcessManager.Connection", type: bytes, message: bytes
+    ):
+        """Processes a request from a worker.
+
+        See :py:func:`send_bytes` for a description of message encoding.
+
+        Args:
+            connection (ProcessManager.Connection): The connection to the worker that sent the request.
+            type (bytes): Encoded request type.
+            message (bytes): Raw message bytes.
+        """
+        if type == b"n" or type == b"t":
+            assert message == b""
+            if type == b"t":
+                with self.tasks_left_lock:
+                    self.tasks_left -= 1
+                    if self.tasks_left == 0:
+                        self.message_available.notify_all()
+            if self.running:
+                task: typing.Optional[bytes] = None
+                for task_queue in self.task_queues:
+                    if len(task_queue) > 0:
+                        task = task_queue.popleft()
+                        break
+                if task is None:
+                    self.respond(
+                        connection=connection, type=b"t", message=pickle.dumps(None)
+                    )
+                else:
+                    self.respond(connection=connection, type=b"t", message=task)
+            else:
+                self.respond(
+                    connection=connection,
+                    type=b"t",
+                    message=pickle.dumps(CloseRequest()),
+                )
+        elif type == b"m":
+            decoded_message = pickle.loads(message)
+            with self.message_available:
+                self.message_queue.append(decoded_message)
+                self.message_available.notify_all()
+            self.respond(connection=connection, type=b"m", message=b"")
+        elif type >= b"\x80":
+            self.task_queues[int.from_bytes(type, byteorder="little") - 128].append(
+                message
+            )
+            with self.tasks_left_lock:
+                self.tasks_left += 1
+            self.respond(connection=connection, type=b"s", message=b"")
+        else:
+            raise Exception(f'unexpected request type "{type}"')
 
     def close(self, policy: "ProcessManager.ClosePolicy"):
         """Terminates the manager.
@@ -472,21 +757,18 @@ class ProcessManager(Manager):
             self.running = False
             for worker in self.workers:
                 worker.join()
-            self.server.shutdown()
-            self.server.server_close()
+            self.serving = False
             self.serve_thread.join()
         elif policy == ProcessManager.ClosePolicy.CANCEL:
             self.running = False
             for worker in self.workers:
                 worker.join()
-            self.server.shutdown()
-            self.server.server_close()
+            self.serving = False
             self.serve_thread.join()
         elif policy == ProcessManager.ClosePolicy.KILL:
             for worker in self.workers:
                 worker.kill()
-            self.server.shutdown()
-            self.server.server_close()
+            self.serving = False
             self.serve_thread.join()
 
     def __enter__(self):
@@ -526,7 +808,9 @@ class ProcessManager(Manager):
             self.tasks_left += 1
 
     def send_message(self, message: typing.Any):
-        self.message_queue.append(message)
+        with self.message_available:
+            self.message_queue.append(message)
+            self.message_available.notify_all()
 
     def messages(self) -> typing.Iterable[typing.Any]:
         """Iterates over the messages sent by all workers until all the tasks are complete.
@@ -541,9 +825,10 @@ class ProcessManager(Manager):
             try:
                 message = self.message_queue.popleft()
             except IndexError:
-                with self.tasks_left_lock:
-                    if self.tasks_left == 0:
-                        return
-                time.sleep(constants.CONSUMER_POLL_PERIOD)
+                with self.message_available:
+                    while len(self.message_queue) == 0:
+                        if self.tasks_left == 0:
+                            return
+                        self.message_available.wait(constants.CONSUMER_POLL_PERIOD)
                 continue
             yield message
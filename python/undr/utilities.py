@@ -4,9 +4,13 @@ from __future__ import annotations
 
 import hashlib
 import json
-import math
+import mmap
+import os
 import pathlib
 import pkgutil
+import queue
+import stat
+import threading
 import typing
 
 import fastjsonschema
@@ -29,17 +33,17 @@ def load_schema(name: str) -> typing.Callable[[typing.Any], None]:
 
 
 def least_multiple_over_chunk_size(word_size: int) -> int:
-    """Calculates the maximum number of bytes in a chunk that can be divided into full words.
+    """Calculates the smallest number of bytes that is at least the chunk size and that can be divided into full words.
 
-    For instance, for a chunks size of 100 bytes and a word size of 32 bytes, this function would return 96.
+    For instance, for a chunks size of 100 bytes and a word size of 32 bytes, this function would return 128.
 
     Args:
         word_size (int): The word size in bytes. The chunk size is not a parameter since UNDR always uses :py:attr:`undr.constants.CHUNK_SIZE`.
 
     Returns:
-        int: Maximum number of bytes in a chunk that can be divided into full words. This number is guaranteed to be a multiple of word_size. It may be zero.
+        int: Smallest number of bytes larger than or equal to the chunk size that can be divided into full words. This number is guaranteed to be a multiple of word_size.
     """
-    return word_size * int(math.ceil(constants.CHUNK_SIZE / word_size))
+    return word_size * -(-constants.CHUNK_SIZE // word_size)
 
 
 def path_with_suffix(path: pathlib.Path, suffix: str) -> pathlib.Path:
@@ -52,7 +56,7 @@ def path_with_suffix(path: pathlib.Path, suffix: str) -> pathlib.Path:
     Returns:
         pathlib.Path: New path with the given suffix.
     """
-    return pathlib.Path(f"{path}{suffix}")
+    return path.with_name(f"{path.name}{suffix}")
 
 
 def posix_path_with_suffix(
@@ -69,16 +73,42 @@ def posix_path_with_suffix(
     Returns:
         pathlib.PurePosixPath: New path with the given suffix.
     """
-    return pathlib.PurePosixPath(f"{path}{suffix}")
+    return path.with_name(f"{path.name}{suffix}")
+
+
+def file_size(path: pathlib.Path) -> typing.Optional[int]:
+    """Returns the size of a regular file with a single system call.
+
+    This function replaces the pair :py:meth:`pathlib.Path.is_file` and :py:meth:`pathlib.Path.stat`, which calls stat twice.
+
+    Args:
+        path (pathlib.Path): Path of the file.
+
+    Returns:
+        typing.Optional[int]: The file size in bytes, or None if the path does not exist or is not a regular file.
+    """
+    try:
+        status = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    if not stat.S_ISREG(status.st_mode):
+        return None
+    return status.st_size
+
+
+HASH_CONSTRUCTOR: typing.Callable[[], "hashlib._Hash"] = getattr(
+    hashlib, constants.HASH_ALGORITHM
+)
+"""Hasher constructor for :py:attr:`undr.constants.HASH_ALGORITHM`, resolved once at import time."""
 
 
 def new_hash() -> "hashlib._Hash":
     """Creates a new byte hasher.
 
     Returns:
-        hashlib._Hash: SHA3-224 (FIPS 202) hasher.
+        hashlib._Hash: SHA3-224 (FIPS 202) hasher (see :py:attr:`undr.constants.HASH_ALGORITHM`).
     """
-    return hashlib.sha3_224()
+    return HASH_CONSTRUCTOR()
 
 
 def hash(chunks: typing.Iterable[bytes]) -> "hashlib._Hash":
@@ -98,16 +128,115 @@ def hash(chunks: typing.Iterable[bytes]) -> "hashlib._Hash":
     return hash_object
 
 
-def hash_file(path: pathlib.Path, chunk_size: int):
+def read_ahead(input: typing.BinaryIO, chunk_size: int) -> typing.Iterator[bytes]:
+    """Reads a stream in a background thread and yields its chunks.
+
+    The next chunks are read while the caller processes the current one, which overlaps disk reads with computations that release the GIL (hashing, decompression). At most two chunks are buffered.
+
+    Args:
+        input (typing.BinaryIO): Stream to read. The caller is responsible for closing it after the iterator is exhausted or closed.
+        chunk_size (int): Chunk size in bytes.
+
+    Returns:
+        typing.Iterator[bytes]: The stream's chunks. The last chunk may be shorter than chunk_size.
+    """
+    chunks: queue.Queue[typing.Union[bytes, BaseException]] = queue.Queue(maxsize=2)
+    stop = threading.Event()
+
+    def target():
+        try:
+            while not stop.is_set():
+                chunk = input.read(chunk_size)
+                chunks.put(chunk)
+                if len(chunk) == 0:
+                    break
+        except BaseException as exception:
+            chunks.put(exception)
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, BaseException):
+                raise chunk
+            if len(chunk) == 0:
+                break
+            yield chunk
+    finally:
+        stop.set()
+        while thread.is_alive():
+            try:
+                chunks.get(timeout=constants.WORKER_POLL_PERIOD)
+            except queue.Empty:
+                pass
+        thread.join()
+
+
+def read_chunks(input: typing.BinaryIO, chunk_size: int) -> typing.Iterator[bytes]:
+    """Reads a file in chunks, in a background thread if the file is large.
+
+    Files larger than :py:attr:`undr.constants.READ_AHEAD_THRESHOLD` are read with :py:func:`read_ahead`, smaller files are read in the calling thread.
+
+    Args:
+        input (typing.BinaryIO): File to read. The caller is responsible for closing it after the iterator is exhausted or closed.
+        chunk_size (int): Chunk size in bytes.
+
+    Returns:
+        typing.Iterator[bytes]: The file's chunks. The last chunk may be shorter than chunk_size.
+    """
+    if os.fstat(input.fileno()).st_size > constants.READ_AHEAD_THRESHOLD:
+        yield from read_ahead(input=input, chunk_size=chunk_size)
+    else:
+        while True:
+            chunk = input.read(chunk_size)
+            if len(chunk) == 0:
+                break
+            yield chunk
+
+
+def hash_file_mmap(path: pathlib.Path) -> "hashlib._Hash":
+    """Calculates a file's hash by mapping it in memory.
+
+    The hasher consumes the whole file in a single :py:meth:`hashlib._Hash.update` call, without copying its bytes to Python buffers. The kernel is advised that the file will be read sequentially, if the platform supports it.
+
+    Args:
+        path (pathlib.Path): Path of the file to hash.
+
+    Raises:
+        OSError: if the file cannot be mapped in memory.
+        ValueError: if the file cannot be mapped in memory.
+
+    Returns:
+        hashlib._Hash: SHA3-224 (FIPS 202) hasher. Use :py:meth:`hashlib._Hash.digest` or :py:meth:`hashlib._Hash.hexdigest` to read the hash value.
+    """
+    hash_object = new_hash()
+    with open(path, "rb") as input:
+        if os.fstat(input.fileno()).st_size == 0:
+            return hash_object
+        with mmap.mmap(input.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                view.madvise(mmap.MADV_SEQUENTIAL)
+            hash_object.update(view)
+    return hash_object
+
+
+def hash_file(path: pathlib.Path, chunk_size: int) -> "hashlib._Hash":
     """Calculates a file's hash.
 
+    Files are hashed with :py:func:`hash_file_mmap`. Files that cannot be mapped in memory are read in chunks instead.
+
     Args:
         path (pathlib.Path): Path of the file to hash.
-        chunk_size (int): Chunk size in bytes, used to read the file.
+        chunk_size (int): Chunk size in bytes, used to read the file if it cannot be mapped in memory.
 
     Returns:
-        _type_: _description_
+        hashlib._Hash: SHA3-224 (FIPS 202) hasher. Use :py:meth:`hashlib._Hash.digest` or :py:meth:`hashlib._Hash.hexdigest` to read the hash value.
     """
+    try:
+        return hash_file_mmap(path=path)
+    except (OSError, ValueError):
+        pass
     with open(path, "rb") as input:
         return hash(iter(lambda: input.read(chunk_size), b""))
 
@@ -123,12 +252,12 @@ def duration_to_string(duration: float) -> str:
     """
     duration = round(duration)
     if duration < 180:
-        return f'{"{:.0f}".format(duration)} s'
+        return f"{duration} s"
     if duration < 10800:
-        return f'{"{:.0f}".format(math.floor(duration / 60))} min'
+        return f"{duration // 60} min"
     if duration < 259200:
-        return f'{"{:.0f}".format(math.floor(duration / 3600))} h'
-    return f'{"{:.0f}".format(math.floor(duration / 86400))} days'
+        return f"{duration // 3600} h"
+    return f"{duration // 86400} days"
 
 
 def size_to_string(size: int) -> str:
@@ -141,14 +270,14 @@ def size_to_string(size: int) -> str:
         str: Human-redable representation.
     """
     if size < 1000:
-        return f'{"{:.0f}".format(size)} B'
+        return f"{size:.0f} B"
     if size < 1000000:
-        return f'{"{:.2f}".format(size / 1000)} kB'
+        return f"{size / 1000:.2f} kB"
     if size < 1000000000:
-        return f'{"{:.2f}".format(size / 1000000)} MB'
+        return f"{size / 1000000:.2f} MB"
     if size < 1000000000000:
-        return f'{"{:.2f}".format(size / 1000000000)} GB'
-    return f'{"{:.2f}".format(size / 1000000000000)} TB'
+        return f"{size / 1000000000:.2f} GB"
+    return f"{size / 1000000000000:.2f} TB"
 
 
 def speed_to_string(speed: int) -> str:
@@ -161,11 +290,11 @@ def speed_to_string(speed: int) -> str:
         str: Human-redable representation.
     """
     if speed < 1000:
-        return f'{"{:.0f}".format(speed)} B/s'
+        return f"{speed:.0f} B/s"
     if speed < 1000000:
-        return f'{"{:.2f}".format(speed / 1000)} kB/s'
+        return f"{speed / 1000:.2f} kB/s"
     if speed < 1000000000:
-        return f'{"{:.2f}".format(speed / 1000000)} MB/s'
+        return f"{speed / 1000000:.2f} MB/s"
     if speed < 1000000000000:
-        return f'{"{:.2f}".format(speed / 1000000000)} GB/s'
-    return f'{"{:.2f}".format(speed / 1000000000000)} TB/s'
+        return f"{speed / 1000000000:.2f} GB/s"
+    return f"{speed / 1000000000000:.2f} TB/s"
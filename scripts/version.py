@@ -1,20 +1,17 @@
 import json
 import pathlib
-import re
 import sys
 import tomllib
 
 dirname = pathlib.Path(__file__).resolve().parent
 
-VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
-
 
 def string_to_version(string: str) -> tuple[int, int, int]:
-    version_match = VERSION_PATTERN.match(string)
-    if version_match is None:
+    parts = string.split(".")
+    if len(parts) != 3 or not all(part.isdecimal() for part in parts):
         sys.stderr.write(f"{string} did not match the expected version pattern")
         sys.exit(1)
-    return (int(version_match[1]), int(version_match[2]), int(version_match[3]))
+    return (int(parts[0]), int(parts[1]), int(parts[2]))
 
 
 def version_to_string(version: tuple[int, int, int]):
@@ -25,18 +22,16 @@ with open(dirname.parent / "app" / "src-tauri" / "tauri.conf.json") as tauri_fil
     tauri = json.load(tauri_file)
 app_version = string_to_version(tauri["package"]["version"])
 with open(dirname.parent / "app" / "src-tauri" / "Cargo.toml", "rb") as cargo_file:
-    app_version_cargo = string_to_version(
-        tomllib.load(cargo_file)["package"]["version"]
+    app_cargo = tomllib.load(cargo_file)
+app_version_cargo = string_to_version(app_cargo["package"]["version"])
+if app_version_cargo != app_version:
+    sys.stderr.write(
+        f'mismatched versions in "app/src-tauri/tauri.conf.json" and "app/src-tauri/Cargo.toml" ({app_version} and {app_version_cargo})'
     )
-    if app_version_cargo != app_version:
-        sys.stderr.write(
-            f'mismatched versions in "app/src-tauri/tauri.conf.json" and "app/src-tauri/Cargo.toml" ({app_version} and {app_version_cargo})'
-        )
-        sys.exit(1)
+    sys.exit(1)
 
-exec(
-    open(dirname.parent / "python" / "source" / "version.py").read()
-)  # defines __version__
+with open(dirname.parent / "python" / "undr" / "version.py", "rb") as version_file:
+    exec(version_file.read().decode("utf-8"))  # defines __version__
 python_version = string_to_version(__version__)  # type: ignore
 
 with open(dirname.parent / "rust" / "Cargo.toml", "rb") as cargo_file: